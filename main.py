@@ -200,9 +200,8 @@ def main():
         controller.main_window = window
         logger.info("Controller main_window reference set")
 
-        # Set main_window reference in browser_manager for positioning
-        controller.browser_manager.set_main_window(window)
-        logger.info("Browser manager main_window reference set")
+        # The browser manager is created lazily and takes controller.main_window
+        # for positioning at that point (see MainController.browser_manager)
 
         # Load categories into sidebar
         logger.info("Loading categories into UI...")
@@ -8,6 +8,20 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# get_session_tabs filtra por sesión y ordena por posición; get_sessions /
+# get_last_auto_save_session filtran por is_auto_save y ordenan por fecha
+SESSION_INDEXES = (
+    "DROP INDEX IF EXISTS idx_session_tabs_session_id",
+    "DROP INDEX IF EXISTS idx_session_tabs_position",
+    "CREATE INDEX IF NOT EXISTS idx_session_tabs_session_position ON session_tabs(session_id, position)",
+    "CREATE INDEX IF NOT EXISTS idx_browser_sessions_autosave_created ON browser_sessions(is_auto_save, created_at DESC)",
+)
+
+def create_indexes(cursor):
+    """Crea (o actualiza) los índices de las tablas de sesiones."""
+    for statement in SESSION_INDEXES:
+        cursor.execute(statement)
+
 def migrate():
     """Agrega las tablas de sesiones para el navegador."""
     db_path = "widget_sidebar.db"
@@ -23,7 +37,9 @@ def migrate():
         """)
 
         if cursor.fetchone():
-            logger.info("La tabla 'browser_sessions' ya existe. No se requiere migración.")
+            create_indexes(cursor)
+            conn.commit()
+            logger.info("La tabla 'browser_sessions' ya existe. Índices actualizados.")
             return
 
         # Crear tabla de sesiones
@@ -52,13 +68,7 @@ def migrate():
         """)
 
         # Crear índices
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_session_tabs_session_id ON session_tabs(session_id)
-        """)
-
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_session_tabs_position ON session_tabs(position)
-        """)
+        create_indexes(cursor)
 
         conn.commit()
         logger.info("✓ Tabla 'browser_sessions' creada exitosamente")
@@ -1,5 +1,6 @@
 """Script para poblar la base de datos con datos de prueba"""
 import sqlite3
+import json
 import random
 from datetime import datetime, timedelta
 import sys
@@ -187,7 +188,8 @@ def populate_database():
                     item["label"],
                     item["content"],
                     item["type"],
-                    item.get("tags", ""),
+                    # Tags como array JSON (formato que guarda DBManager)
+                    json.dumps([tag.strip() for tag in item.get("tags", "").split(",") if tag.strip()]),
                     item.get("description", ""),
                     item.get("is_sensitive", False),
                     is_favorite,
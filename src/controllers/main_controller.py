@@ -2,8 +2,12 @@
 Main Controller
 """
 import sys
+import json
+import atexit
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from PyQt6.QtCore import QTimer
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config_manager import ConfigManager
@@ -21,6 +25,28 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Relative cost of each CategoryFilterEngine predicate; cheaper ones are
+# emitted first in the WHERE clause. Unknown keys (order_by, limit, ...) sort last.
+_FILTER_COST = {
+    'is_active': 0, 'is_predefined': 0, 'is_pinned': 0, 'color_value': 0,
+    'never_accessed': 0, 'has_color': 1, 'has_badge': 1,
+    'item_count_min': 1, 'item_count_max': 1, 'total_uses_min': 1, 'total_uses_max': 1,
+    'access_count_min': 1, 'access_count_max': 1,
+    'created_after': 2, 'created_before': 2, 'updated_after': 2, 'updated_before': 2,
+    'accessed_after': 2, 'accessed_before': 2,
+    'search_text': 3,
+}
+
+# Max number of filter results kept by MainController (LFU eviction)
+FILTER_RESULT_CACHE_SIZE = 16
+
+# Delay before building the browser's QWebEngineProfile once the app is idle
+# (only with the "prewarm_browser" setting enabled)
+BROWSER_PREWARM_DELAY_MS = 2000
+
+# Interval between background PRAGMA optimize runs (planner statistics)
+DB_OPTIMIZE_INTERVAL_MS = 15 * 60 * 1000
+
 
 class MainController:
     """Main application controller - coordinates all app logic"""
@@ -29,9 +55,10 @@ class MainController:
         # Initialize managers
         self.config_manager = ConfigManager(db_path="widget_sidebar.db")
         self.clipboard_manager = ClipboardManager()
-        self.category_filter_engine = CategoryFilterEngine(db_path="widget_sidebar.db")
-        self.pinned_panels_manager = PinnedPanelsManager(self.config_manager.db)
-        self.browser_manager = SimpleBrowserManager(self.config_manager.db)
+        # Created on first use (see properties below) to keep startup light
+        self._category_filter_engine: Optional[CategoryFilterEngine] = None
+        self._pinned_panels_manager: Optional[PinnedPanelsManager] = None
+        self._browser_manager: Optional[SimpleBrowserManager] = None
         self.notebook_manager = NotebookManager(self.config_manager.db)
         self.workarea_manager = WorkareaManager()
 
@@ -40,40 +67,93 @@ class MainController:
         self.list_controller = ListController(self.config_manager.db, self.clipboard_manager)
 
         # Data
-        self.categories: List[Category] = []  # All categories (unfiltered, for compatibility)
         self._all_categories: List[Category] = []  # Master list: ALL categories from DB
         self._filtered_categories: List[Category] = []  # Filtered categories for UI
         self._filters_active: bool = False  # Flag to track if filters are active
+        self._category_index: Dict[str, Category] = {}  # id -> Category lookup for get_category
+        self._all_category_ids: Set[str] = set()  # ids in _all_categories
+        self._filtered_category_ids: Set[str] = set()  # ids in _filtered_categories
+        # Results are stored as tuples and handed out as fresh lists, so callers can't mutate them
+        self._filter_result_cache: "OrderedDict[str, Tuple[Category, ...]]" = OrderedDict()
+        self._filter_result_hits: Dict[str, int] = {}  # LFU use counters for the cache above
         self.current_category: Optional[Category] = None
         self.main_window = None  # Will be set by main.py
 
         # Load initial data
         self.load_data()
 
+        # Opt-in: build the browser profile off the click path (the window
+        # itself stays lazy); by default the browser is only created on first use
+        if self.config_manager.get_setting("prewarm_browser", False):
+            QTimer.singleShot(BROWSER_PREWARM_DELAY_MS, self._prewarm_browser_profile)
+
+        # Keep query plans current in long sessions; runs on the DB IO thread
+        self._db_optimize_timer = QTimer()
+        self._db_optimize_timer.setInterval(DB_OPTIMIZE_INTERVAL_MS)
+        self._db_optimize_timer.timeout.connect(
+            lambda: self.config_manager.db.submit(self.config_manager.db.optimize)
+        )
+        self._db_optimize_timer.start()
+
+        # Deterministic shutdown (atexit is LIFO) instead of relying on __del__
+        atexit.register(self._cleanup)
+
+    @property
+    def category_filter_engine(self) -> CategoryFilterEngine:
+        """Category filter engine (lazy: most sessions never open the filter window)"""
+        if self._category_filter_engine is None:
+            # Results are cached here (_filter_result_cache), not in the engine
+            self._category_filter_engine = CategoryFilterEngine(
+                db_manager=self.config_manager.db, cache_enabled=False
+            )
+        return self._category_filter_engine
+
+    @property
+    def pinned_panels_manager(self) -> PinnedPanelsManager:
+        """Pinned panels manager (lazy)"""
+        if self._pinned_panels_manager is None:
+            self._pinned_panels_manager = PinnedPanelsManager(self.config_manager.db)
+        return self._pinned_panels_manager
+
+    @property
+    def browser_manager(self) -> SimpleBrowserManager:
+        """Embedded browser manager (lazy, picks up main_window if already set)"""
+        if self._browser_manager is None:
+            self._browser_manager = SimpleBrowserManager(self.config_manager.db, self.main_window)
+        return self._browser_manager
+
     def load_data(self) -> None:
         """Load configuration and categories"""
-        print("Loading configuration...")
+        logger.info("Loading configuration...")
         self.config_manager.load_config()
 
-        print("Loading categories...")
+        logger.info("Loading categories...")
         self._all_categories = self.config_manager.load_default_categories()
-        self.categories = self._all_categories  # Initially, categories = all categories
         self._filters_active = False
+        self._category_index = {c.id: c for c in self._all_categories}
+        self._all_category_ids = set(self._category_index)
+
+        logger.info(f"Loaded {len(self.categories)} categories")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Categories: %s", ", ".join(f"{c.name}({len(c.items)})" for c in self.categories))
 
-        print(f"Loaded {len(self.categories)} categories")
-        for cat in self.categories:
-            print(f"  - {cat.name}: {len(cat.items)} items")
+    @property
+    def categories(self) -> List[Category]:
+        """Categories currently shown in the UI (filtered if filters are active)"""
+        return self._filtered_categories if self._filters_active else self._all_categories
 
-    def get_categories(self, include_filtered: bool = True) -> List[Category]:
+    def get_categories(self, include_filtered: bool = True) -> Sequence[Category]:
         """
         Get categories
 
+        The controller's own list is returned (no copy): treat it as read-only.
+
         Args:
             include_filtered: If True and filters are active, return filtered categories.
                              If False, always return all categories from database.
 
         Returns:
-            List of categories
+            Read-only sequence of categories
         """
         if include_filtered and self._filters_active:
             # Return filtered categories if filters are active
@@ -83,9 +163,18 @@ class MainController:
             return self._all_categories
 
     def get_category(self, category_id: str) -> Optional[Category]:
-        """Get a specific category by ID"""
+        """Get a specific category by ID (in-memory index first, DB on miss)"""
+        category = self._category_index.get(category_id)
+        if category is not None:
+            return category
         return self.config_manager.get_category(category_id)
 
+    def is_category_visible(self, category_id: str) -> bool:
+        """Check whether a category is part of the current (possibly filtered) view"""
+        if self._filters_active:
+            return category_id in self._filtered_category_ids
+        return category_id in self._all_category_ids
+
     def set_current_category(self, category_id: str) -> bool:
         """Set the currently active category"""
         category = self.get_category(category_id)
@@ -125,47 +214,71 @@ class MainController:
         try:
             logger.info(f"Applying category filters: {filters}")
 
-            # Use CategoryFilterEngine to get filtered categories
-            filtered_categories = self.category_filter_engine.apply_filters(filters)
+            # Repeated filter sets (filter window reopened) are served from the LFU cache
+            cache_key = json.dumps(filters, sort_keys=True, default=str)
+            cached = self._filter_result_cache.get(cache_key)
+            if cached is not None:
+                filtered_categories = list(cached)
+                self._filter_result_hits[cache_key] += 1
+                logger.debug("Filter result served from controller cache")
+            else:
+                # Use CategoryFilterEngine to get filtered categories; it raises on
+                # error, so failed queries never reach the cache
+                filtered_categories = self.category_filter_engine.apply_filters(self._order_filters(filters))
+                self._cache_filter_result(cache_key, filtered_categories)
 
             logger.info(f"Filter result: {len(filtered_categories)} categories")
 
             # Store filtered categories separately (DO NOT replace self._all_categories)
             self._filtered_categories = filtered_categories
+            self._filtered_category_ids = {c.id for c in filtered_categories}
             self._filters_active = True
 
-            # For backward compatibility, also update self.categories
-            self.categories = filtered_categories
-
             # Update the UI (sidebar) if main_window is available
             if self.main_window:
                 self.main_window.load_categories(filtered_categories)
                 logger.debug("Sidebar updated with filtered categories")
 
-            # Get and log filter stats
-            stats = self.category_filter_engine.get_filter_stats()
-            cache_stats = self.category_filter_engine.get_cache_stats()
-
-            if stats:
-                logger.info(
-                    f"Filter stats: {stats.filtered_categories}/{stats.total_categories} "
-                    f"categories, {stats.active_filters_count} filters, "
-                    f"{stats.execution_time_ms:.2f}ms"
-                )
-
-            if cache_stats:
-                logger.debug(
-                    f"Cache stats: {cache_stats['cache_hits']} hits, "
-                    f"{cache_stats['cache_misses']} misses, "
-                    f"{cache_stats['hit_rate']:.1f}% hit rate, "
-                    f"{cache_stats['cache_size']}/{cache_stats['cache_max_size']} entries"
-                )
+            # Get and log filter stats (skipped entirely when the level is disabled)
+            if logger.isEnabledFor(logging.INFO):
+                stats = self.category_filter_engine.get_filter_stats()
+                if stats:
+                    logger.info(
+                        f"Filter stats: {stats.filtered_categories}/{stats.total_categories} "
+                        f"categories, {stats.active_filters_count} filters, "
+                        f"{stats.execution_time_ms:.2f}ms"
+                    )
+
+            logger.debug(
+                f"Filter result cache: {len(self._filter_result_cache)}/"
+                f"{FILTER_RESULT_CACHE_SIZE} entries"
+            )
 
         except Exception as e:
             logger.error(f"Error applying category filters: {e}", exc_info=True)
             # On error, reload all categories
             self.load_all_categories()
 
+    @staticmethod
+    def _order_filters(filters: dict) -> dict:
+        """Return filters with cheap predicates first (see _FILTER_COST)"""
+        return dict(sorted(filters.items(), key=lambda kv: _FILTER_COST.get(kv[0], 4)))
+
+    def _cache_filter_result(self, cache_key: str, categories: List[Category]) -> None:
+        """Store a filter result, evicting the least frequently used entry when full"""
+        if len(self._filter_result_cache) >= FILTER_RESULT_CACHE_SIZE:
+            # min() walks the OrderedDict in insertion order, so ties evict the oldest
+            victim = min(self._filter_result_cache, key=self._filter_result_hits.__getitem__)
+            del self._filter_result_cache[victim]
+            del self._filter_result_hits[victim]
+        self._filter_result_cache[cache_key] = tuple(categories)
+        self._filter_result_hits[cache_key] = 1
+
+    def _clear_filter_result_cache(self) -> None:
+        """Drop all cached filter results"""
+        self._filter_result_cache.clear()
+        self._filter_result_hits.clear()
+
     def load_all_categories(self) -> None:
         """
         Load all categories without filters (clear filters)
@@ -174,13 +287,17 @@ class MainController:
             logger.info("Loading all categories (clearing filters)")
 
             # Clear filter engine cache (database may have changed)
-            self.category_filter_engine.clear_cache()
+            if self._category_filter_engine is not None:
+                self._category_filter_engine.clear_cache()
+            self._clear_filter_result_cache()
 
             # Reload ALL categories from database
             self._all_categories = self.config_manager.load_default_categories()
-            self.categories = self._all_categories  # Reset to all categories
             self._filtered_categories = []
+            self._filtered_category_ids = set()
             self._filters_active = False
+            self._category_index = {c.id: c for c in self._all_categories}
+            self._all_category_ids = set(self._category_index)
 
             logger.info(f"Loaded {len(self.categories)} categories")
 
@@ -198,10 +315,20 @@ class MainController:
         This should be called after any category/item modifications
         """
         logger.debug("Invalidating filter engine cache")
-        self.category_filter_engine.clear_cache()
-        # Also clear config manager cache
-        if hasattr(self.config_manager, '_categories_cache'):
-            self.config_manager._categories_cache = None
+        if self._category_filter_engine is not None:
+            self._category_filter_engine.clear_cache()
+        self._clear_filter_result_cache()
+        self._category_index.clear()
+        self.config_manager.invalidate_cache()
+
+    def _prewarm_browser_profile(self) -> None:
+        """Create the persistent QWebEngineProfile so the first browser show is fast"""
+        try:
+            # activate=False: not the current profile yet and last_used untouched
+            self.browser_manager.profile_manager.get_or_create_profile(activate=False)
+            logger.debug("Browser profile pre-warmed")
+        except Exception as e:
+            logger.warning(f"Could not pre-warm browser profile: {e}")
 
     def toggle_browser(self):
         """Toggle browser window visibility"""
@@ -212,9 +339,18 @@ class MainController:
             logger.error(f"Error toggling browser: {e}", exc_info=True)
             raise
 
-    def __del__(self):
-        """Cleanup: close database connection and browser"""
-        if hasattr(self, 'browser_manager'):
-            self.browser_manager.cleanup()
-        if hasattr(self, 'config_manager'):
+    def _cleanup(self) -> None:
+        """Cleanup at exit: close browser and database connection"""
+        try:
+            self._db_optimize_timer.stop()
+        except Exception:
+            pass
+        try:
+            if self._browser_manager is not None:
+                self._browser_manager.cleanup()
+        except Exception:
+            pass
+        try:
             self.config_manager.close()
+        except Exception:
+            pass
@@ -8,14 +8,55 @@ LocalStorage, cache y sesiones de autenticación entre ejecuciones.
 """
 
 import logging
+import os
+import shutil
+import time
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, Set, Tuple
 import sys
 
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWebEngineCore import QWebEngineProfile
 
 logger = logging.getLogger(__name__)
 
+# Intervalo para agrupar las escrituras de last_used en un solo UPDATE
+LAST_USED_FLUSH_MS = 5000
+
+# Segundos que se reutiliza un tamaño de perfil cacheado aunque no cambie el
+# mtime (Chromium escribe en subdirectorios profundos que no lo actualizan)
+PROFILE_SIZE_CACHE_TTL = 30.0
+
+
+class _RemoveTreeSignals(QObject):
+    """Señales de _RemoveTreeTask (QRunnable no es QObject)"""
+    finished = pyqtSignal(str)
+
+
+class _RemoveTreeTask(QRunnable):
+    """
+    Elimina un directorio en un hilo del QThreadPool.
+
+    Un cache de Chromium puede tener miles de archivos; borrarlo en el hilo
+    de UI congela la ventana varios segundos.
+    """
+
+    def __init__(self, path: Path, recreate: bool = False):
+        super().__init__()
+        self.path = path
+        self.recreate = recreate
+        self.signals = _RemoveTreeSignals()
+
+    def run(self):
+        # ignore_errors: un archivo bloqueado no debe dejar el hilo colgado
+        shutil.rmtree(self.path, ignore_errors=True)
+        if self.recreate:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.error(f"No se pudo recrear {self.path}: {e}")
+        self.signals.finished.emit(str(self.path))
+
 
 class BrowserProfileManager:
     """
@@ -46,6 +87,19 @@ class BrowserProfileManager:
         self.current_profile: Optional[QWebEngineProfile] = None
         self.current_profile_id: Optional[int] = None
 
+        # Perfiles ya construidos: profile_id -> QWebEngineProfile (crearlos es caro)
+        self._profiles: Dict[int, QWebEngineProfile] = {}
+
+        # Caché de tamaños en disco: profile_id -> (mtime, instante del cálculo, bytes)
+        self._size_cache: Dict[int, Tuple[float, float, int]] = {}
+
+        # last_used pendientes de escribir (se vuelcan juntos al expirar el timer)
+        self._pending_last_used: Set[int] = set()
+        self._last_used_timer = QTimer()
+        self._last_used_timer.setSingleShot(True)
+        self._last_used_timer.setInterval(LAST_USED_FLUSH_MS)
+        self._last_used_timer.timeout.connect(self.flush_last_used)
+
         # Determinar directorio base para almacenamiento
         if getattr(sys, 'frozen', False):
             self.base_dir = Path(sys.executable).parent
@@ -54,12 +108,15 @@ class BrowserProfileManager:
 
         logger.info("BrowserProfileManager inicializado")
 
-    def get_or_create_profile(self, profile_id: int = None) -> Optional[QWebEngineProfile]:
+    def get_or_create_profile(self, profile_id: int = None,
+                              activate: bool = True) -> Optional[QWebEngineProfile]:
         """
         Obtiene o crea un perfil de navegador persistente.
 
         Args:
             profile_id: ID del perfil a cargar (None = perfil por defecto)
+            activate: Si False, solo construye el perfil (pre-carga) sin
+                      hacerlo el actual ni actualizar last_used
 
         Returns:
             QWebEngineProfile: Perfil persistente o None si falla
@@ -78,10 +135,17 @@ class BrowserProfileManager:
                     logger.error(f"Perfil {profile_id} no encontrado")
                     return None
 
-            # Si ya tenemos el perfil cargado, reutilizarlo
-            if self.current_profile and self.current_profile_id == profile_id:
+            # Si ya construimos este perfil, reutilizarlo
+            profile = self._profiles.get(profile_id)
+            if profile is not None:
                 logger.debug(f"Reutilizando perfil cargado: {profile_data['name']}")
-                return self.current_profile
+                if not activate:
+                    return profile
+                if self.current_profile_id != profile_id:
+                    self._mark_last_used(profile_id)
+                self.current_profile = profile
+                self.current_profile_id = profile_id
+                return profile
 
             # Crear nuevo perfil persistente
             profile_name = profile_data['name']
@@ -110,12 +174,14 @@ class BrowserProfileManager:
             # Configurar user agent (opcional)
             # profile.setHttpUserAgent("Custom User Agent")
 
-            # Actualizar last_used en la base de datos
-            self.db.update_profile_last_used(profile_id)
-
             # Guardar referencia
-            self.current_profile = profile
-            self.current_profile_id = profile_id
+            self._profiles[profile_id] = profile
+
+            if activate:
+                # Marcar last_used; se escribe en la DB al vencer el timer
+                self._mark_last_used(profile_id)
+                self.current_profile = profile
+                self.current_profile_id = profile_id
 
             logger.info(f"Perfil '{profile_name}' cargado exitosamente")
             return profile
@@ -145,13 +211,7 @@ class BrowserProfileManager:
         """
         logger.info(f"Cambiando a perfil {profile_id}")
 
-        # Limpiar perfil actual
-        if self.current_profile:
-            # El perfil anterior se liberará automáticamente
-            # cuando no haya más referencias a él
-            pass
-
-        # Cargar nuevo perfil
+        # El perfil anterior queda en self._profiles para volver a él sin recrearlo
         return self.get_or_create_profile(profile_id)
 
     def create_new_profile(self, name: str) -> Optional[int]:
@@ -178,13 +238,17 @@ class BrowserProfileManager:
             logger.error(f"Error al crear perfil: {e}")
             return None
 
-    def delete_profile(self, profile_id: int, delete_data: bool = True) -> bool:
+    def delete_profile(self, profile_id: int, delete_data: bool = True,
+                       on_finished: Optional[Callable[[], None]] = None) -> bool:
         """
         Elimina un perfil.
 
+        Los datos en disco se borran en segundo plano (QThreadPool).
+
         Args:
             profile_id: ID del perfil a eliminar
             delete_data: Si True, elimina también los datos en disco
+            on_finished: Callback (hilo de UI) al terminar el borrado en disco
 
         Returns:
             bool: True si se eliminó correctamente
@@ -199,11 +263,12 @@ class BrowserProfileManager:
             if delete_data:
                 profile_data = self.db.get_profile_by_id(profile_id)
                 if profile_data:
+                    # rmtree(ignore_errors) ya tolera un directorio inexistente
                     storage_path = self.base_dir / profile_data['storage_path']
-                    if storage_path.exists():
-                        import shutil
-                        shutil.rmtree(storage_path)
-                        logger.info(f"Datos del perfil eliminados: {storage_path}")
+                    self._remove_tree(storage_path, on_finished=on_finished)
+                    logger.info(f"Eliminando datos del perfil: {storage_path}")
+                self._size_cache.pop(profile_id, None)
+            self._profiles.pop(profile_id, None)
 
             # Eliminar de la base de datos
             success = self.db.delete_browser_profile(profile_id)
@@ -238,15 +303,19 @@ class BrowserProfileManager:
         """
         return self.db.set_default_profile(profile_id)
 
-    def clear_profile_data(self, profile_id: int = None) -> bool:
+    def clear_profile_data(self, profile_id: int = None,
+                           on_finished: Optional[Callable[[], None]] = None) -> bool:
         """
         Limpia los datos de un perfil (cookies, cache, etc).
 
+        El borrado se ejecuta en segundo plano (QThreadPool).
+
         Args:
             profile_id: ID del perfil (None = perfil actual)
+            on_finished: Callback (hilo de UI) al terminar la limpieza
 
         Returns:
-            bool: True si se limpió correctamente
+            bool: True si la limpieza se inició correctamente
         """
         try:
             if profile_id is None:
@@ -263,12 +332,11 @@ class BrowserProfileManager:
 
             storage_path = self.base_dir / profile_data['storage_path']
 
-            if storage_path.exists():
-                import shutil
-                # Eliminar y recrear el directorio
-                shutil.rmtree(storage_path)
-                storage_path.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Datos del perfil limpiados: {storage_path}")
+            # Eliminar (si existe) y recrear el directorio, sin exists() previo
+            self._remove_tree(storage_path, recreate=True, on_finished=on_finished)
+            logger.info(f"Limpiando datos del perfil: {storage_path}")
+
+            self._size_cache.pop(profile_id, None)
 
             return True
 
@@ -280,6 +348,11 @@ class BrowserProfileManager:
         """
         Calcula el tamaño en disco de un perfil.
 
+        El resultado se cachea junto al mtime más reciente del directorio del
+        perfil y sus subdirectorios directos, y se reutiliza mientras este no
+        cambie y no hayan pasado PROFILE_SIZE_CACHE_TTL segundos (los cambios
+        en niveles más profundos no actualizan esos mtime).
+
         Args:
             profile_id: ID del perfil
 
@@ -293,27 +366,118 @@ class BrowserProfileManager:
 
             storage_path = self.base_dir / profile_data['storage_path']
 
-            if not storage_path.exists():
+            try:
+                mtime = self._tree_mtime(storage_path)
+            except FileNotFoundError:
                 return 0
 
-            total_size = 0
-            for item in storage_path.rglob('*'):
-                if item.is_file():
-                    total_size += item.stat().st_size
+            now = time.monotonic()
+            cached = self._size_cache.get(profile_id)
+            if cached and cached[0] == mtime and now - cached[1] < PROFILE_SIZE_CACHE_TTL:
+                return cached[2]
+
+            total_size = self._dir_size(storage_path)
 
+            self._size_cache[profile_id] = (mtime, now, total_size)
             return total_size
 
         except Exception as e:
             logger.error(f"Error al calcular tamaño del perfil: {e}")
             return 0
 
+    def _remove_tree(self, path: Path, recreate: bool = False,
+                     on_finished: Optional[Callable[[], None]] = None) -> None:
+        """
+        Programa el borrado de un directorio en QThreadPool.
+
+        Args:
+            path: Directorio a eliminar
+            recreate: Si True, vuelve a crear el directorio vacío
+            on_finished: Callback opcional al terminar
+        """
+        task = _RemoveTreeTask(path, recreate=recreate)
+        task.signals.finished.connect(
+            lambda p: logger.info(f"Directorio de perfil procesado: {p}")
+        )
+        if on_finished:
+            task.signals.finished.connect(lambda _p: on_finished())
+        QThreadPool.globalInstance().start(task)
+
+    @staticmethod
+    def _tree_mtime(path: Path) -> float:
+        """
+        mtime más reciente entre un directorio y sus subdirectorios directos.
+
+        Raises:
+            FileNotFoundError: Si el directorio no existe
+        """
+        mtime = path.stat().st_mtime
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        mtime = max(mtime, entry.stat(follow_symlinks=False).st_mtime)
+                except OSError:
+                    continue
+        return mtime
+
+    @staticmethod
+    def _dir_size(path: Path) -> int:
+        """
+        Suma el tamaño de todos los archivos bajo un directorio.
+
+        Usa os.scandir: cada DirEntry trae el tipo de la entrada, así que solo
+        se hace un stat() por archivo (rglob + is_file + stat hacía dos).
+
+        Args:
+            path: Directorio raíz
+
+        Returns:
+            int: Tamaño total en bytes
+        """
+        total = 0
+        pending = [path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            # Archivo borrado/bloqueado durante el recorrido
+                            pass
+            except OSError:
+                pass
+        return total
+
+    def _mark_last_used(self, profile_id: int):
+        """Encola la actualización de last_used y arranca el timer si está parado."""
+        self._pending_last_used.add(profile_id)
+        # Un perfil en uso escribe en disco: su tamaño cacheado deja de valer
+        self._size_cache.pop(profile_id, None)
+        if not self._last_used_timer.isActive():
+            self._last_used_timer.start()
+
+    def flush_last_used(self):
+        """Escribe en la DB todos los last_used pendientes con un solo UPDATE."""
+        self._last_used_timer.stop()
+        if not self._pending_last_used:
+            return
+        pending, self._pending_last_used = self._pending_last_used, set()
+        self.db.update_profiles_last_used(pending)
+
     def cleanup(self):
         """Limpieza de recursos al cerrar la aplicación."""
         logger.info("Limpiando BrowserProfileManager")
 
-        if self.current_profile:
-            # El perfil se liberará automáticamente
-            self.current_profile = None
-            self.current_profile_id = None
+        self.flush_last_used()
+
+        # Soltar todas las referencias; Qt libera cada perfil cuando ya no lo usa ninguna página
+        self._profiles.clear()
+        self.current_profile = None
+        self.current_profile_id = None
 
         logger.info("BrowserProfileManager limpiado")
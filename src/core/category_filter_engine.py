@@ -48,15 +48,21 @@ class CategoryFilterEngine:
     - Optimización con índices
     """
 
-    def __init__(self, db_path: str, cache_enabled: bool = True, cache_max_size: int = 100):
+    def __init__(self, db_path: Optional[str] = None, cache_enabled: bool = True,
+                 cache_max_size: int = 100, db_manager=None):
         """
         Inicializar el motor de filtrado
 
         Args:
-            db_path: Ruta a la base de datos SQLite
+            db_path: Ruta a la base de datos SQLite (solo si no se pasa db_manager)
             cache_enabled: Si está habilitado el caché de resultados
             cache_max_size: Tamaño máximo del caché (número de entradas)
+            db_manager: DBManager compartido; si se indica las consultas van por
+                        su pool de lectores en lugar de abrir una conexión propia
         """
+        if db_manager is None and db_path is None:
+            raise ValueError("Se requiere db_path o db_manager")
+        self.db = db_manager
         self.db_path = db_path
         self.last_query = None
         self.last_params = None
@@ -79,6 +85,9 @@ class CategoryFilterEngine:
         Returns:
             Lista de categorías que cumplen los filtros
 
+        Raises:
+            Exception: Si la consulta falla (no se cachea ningún resultado)
+
         Ejemplo de filters:
         {
             'is_active': True,
@@ -136,15 +145,10 @@ class CategoryFilterEngine:
             self.last_params = params
 
             # Ejecutar query
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
             logger.debug(f"Executing query: {query}")
             logger.debug(f"Parameters: {params}")
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+            rows = self._query(query, params)
 
             # Convertir a objetos Category
             categories = []
@@ -173,10 +177,7 @@ class CategoryFilterEngine:
                 categories.append(category)
 
             # Obtener total de categorías sin filtro
-            cursor.execute("SELECT COUNT(*) as total FROM categories")
-            total_count = cursor.fetchone()['total']
-
-            conn.close()
+            total_count = self._query("SELECT COUNT(*) as total FROM categories")[0]['total']
 
             # Calcular estadísticas
             end_time = datetime.now()
@@ -202,9 +203,24 @@ class CategoryFilterEngine:
 
         except Exception as e:
             logger.error(f"Error applying filters: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            raise
+
+    def _query(self, query: str, params=()) -> List[Dict[str, Any]]:
+        """
+        Ejecutar un SELECT: por el pool de lectores del DBManager compartido
+        (nunca su conexión de escritura) o por una conexión propia
+
+        Returns:
+            Filas como diccionarios
+        """
+        if self.db is not None:
+            return self.db.execute_query(query, tuple(params))
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
 
     def build_query(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
         """
@@ -218,119 +234,112 @@ class CategoryFilterEngine:
         """
         # Query base
         query_parts = ["SELECT * FROM categories"]
-        where_conditions = []
+        conditions: List[Tuple[str, str, Tuple[Any, ...]]] = []
         params = []
 
+        def add_condition(key: str, sql: str, *values: Any) -> None:
+            conditions.append((key, sql, values))
+
         # === FILTROS DE ESTADO ===
 
         # is_active
         if 'is_active' in filters and filters['is_active'] is not None:
-            where_conditions.append("is_active = ?")
-            params.append(1 if filters['is_active'] else 0)
+            add_condition('is_active', "is_active = ?", 1 if filters['is_active'] else 0)
 
         # is_predefined
         if 'is_predefined' in filters and filters['is_predefined'] is not None:
-            where_conditions.append("is_predefined = ?")
-            params.append(1 if filters['is_predefined'] else 0)
+            add_condition('is_predefined', "is_predefined = ?", 1 if filters['is_predefined'] else 0)
 
         # is_pinned
         if 'is_pinned' in filters and filters['is_pinned'] is not None:
-            where_conditions.append("is_pinned = ?")
-            params.append(1 if filters['is_pinned'] else 0)
+            add_condition('is_pinned', "is_pinned = ?", 1 if filters['is_pinned'] else 0)
 
         # === FILTROS DE POPULARIDAD ===
 
         # item_count (rango)
         if 'item_count_min' in filters and filters['item_count_min'] is not None:
-            where_conditions.append("item_count >= ?")
-            params.append(filters['item_count_min'])
+            add_condition('item_count_min', "item_count >= ?", filters['item_count_min'])
 
         if 'item_count_max' in filters and filters['item_count_max'] is not None:
-            where_conditions.append("item_count <= ?")
-            params.append(filters['item_count_max'])
+            add_condition('item_count_max', "item_count <= ?", filters['item_count_max'])
 
         # total_uses (rango)
         if 'total_uses_min' in filters and filters['total_uses_min'] is not None:
-            where_conditions.append("total_uses >= ?")
-            params.append(filters['total_uses_min'])
+            add_condition('total_uses_min', "total_uses >= ?", filters['total_uses_min'])
 
         if 'total_uses_max' in filters and filters['total_uses_max'] is not None:
-            where_conditions.append("total_uses <= ?")
-            params.append(filters['total_uses_max'])
+            add_condition('total_uses_max', "total_uses <= ?", filters['total_uses_max'])
 
         # access_count (rango)
         if 'access_count_min' in filters and filters['access_count_min'] is not None:
-            where_conditions.append("access_count >= ?")
-            params.append(filters['access_count_min'])
+            add_condition('access_count_min', "access_count >= ?", filters['access_count_min'])
 
         if 'access_count_max' in filters and filters['access_count_max'] is not None:
-            where_conditions.append("access_count <= ?")
-            params.append(filters['access_count_max'])
+            add_condition('access_count_max', "access_count <= ?", filters['access_count_max'])
 
         # === FILTROS DE FECHAS ===
 
         # created_at
         if 'created_after' in filters and filters['created_after']:
-            where_conditions.append("created_at >= ?")
-            params.append(filters['created_after'])
+            add_condition('created_after', "created_at >= ?", filters['created_after'])
 
         if 'created_before' in filters and filters['created_before']:
-            where_conditions.append("created_at <= ?")
-            params.append(filters['created_before'])
+            add_condition('created_before', "created_at <= ?", filters['created_before'])
 
         # updated_at
         if 'updated_after' in filters and filters['updated_after']:
-            where_conditions.append("updated_at >= ?")
-            params.append(filters['updated_after'])
+            add_condition('updated_after', "updated_at >= ?", filters['updated_after'])
 
         if 'updated_before' in filters and filters['updated_before']:
-            where_conditions.append("updated_at <= ?")
-            params.append(filters['updated_before'])
+            add_condition('updated_before', "updated_at <= ?", filters['updated_before'])
 
         # last_accessed
         if 'accessed_after' in filters and filters['accessed_after']:
-            where_conditions.append("last_accessed >= ?")
-            params.append(filters['accessed_after'])
+            add_condition('accessed_after', "last_accessed >= ?", filters['accessed_after'])
 
         if 'accessed_before' in filters and filters['accessed_before']:
-            where_conditions.append("last_accessed <= ?")
-            params.append(filters['accessed_before'])
+            add_condition('accessed_before', "last_accessed <= ?", filters['accessed_before'])
 
         # Categorías no accedidas
         if 'never_accessed' in filters and filters['never_accessed']:
-            where_conditions.append("last_accessed IS NULL")
+            add_condition('never_accessed', "last_accessed IS NULL")
 
         # === FILTROS DE COLOR Y BADGE ===
 
         # has_color
         if 'has_color' in filters and filters['has_color'] is not None:
             if filters['has_color']:
-                where_conditions.append("color IS NOT NULL AND color != ''")
+                add_condition('has_color', "color IS NOT NULL AND color != ''")
             else:
-                where_conditions.append("(color IS NULL OR color = '')")
+                add_condition('has_color', "(color IS NULL OR color = '')")
 
         # has_badge
         if 'has_badge' in filters and filters['has_badge'] is not None:
             if filters['has_badge']:
-                where_conditions.append("badge IS NOT NULL AND badge != ''")
+                add_condition('has_badge', "badge IS NOT NULL AND badge != ''")
             else:
-                where_conditions.append("(badge IS NULL OR badge = '')")
+                add_condition('has_badge', "(badge IS NULL OR badge = '')")
 
         # color_value (color específico)
         if 'color_value' in filters and filters['color_value']:
-            where_conditions.append("color = ?")
-            params.append(filters['color_value'])
+            add_condition('color_value', "color = ?", filters['color_value'])
 
         # === BÚSQUEDA POR NOMBRE ===
 
         if 'search_text' in filters and filters['search_text']:
-            where_conditions.append("name LIKE ?")
-            params.append(f"%{filters['search_text']}%")
+            add_condition('search_text', "name LIKE ?", f"%{filters['search_text']}%")
 
         # === CONSTRUIR WHERE CLAUSE ===
 
-        if where_conditions:
-            query_parts.append("WHERE " + " AND ".join(where_conditions))
+        if conditions:
+            # Emitir condiciones en el orden de las claves de `filters`: el
+            # llamador puede anteponer predicados baratos (igualdad) a los
+            # costosos (LIKE) para que SQLite corte la evaluación antes
+            key_order = {key: index for index, key in enumerate(filters)}
+            conditions.sort(key=lambda cond: key_order.get(cond[0], len(key_order)))
+            query_parts.append("WHERE " + " AND ".join(sql for _, sql, _ in conditions))
+            for _, _, values in conditions:
+                params.extend(values)
 
         # === ORDENAMIENTO ===
 
@@ -386,20 +395,14 @@ class CategoryFilterEngine:
             Lista de colores (hex) únicos
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            rows = self._query("""
                 SELECT DISTINCT color
                 FROM categories
                 WHERE color IS NOT NULL AND color != ''
                 ORDER BY color
             """)
 
-            colors = [row[0] for row in cursor.fetchall()]
-            conn.close()
-
-            return colors
+            return [row['color'] for row in rows]
 
         except Exception as e:
             logger.error(f"Error getting colors: {e}")
@@ -413,10 +416,7 @@ class CategoryFilterEngine:
             Diccionario con fechas mínimas y máximas
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            row = self._query("""
                 SELECT
                     MIN(created_at) as min_created,
                     MAX(created_at) as max_created,
@@ -425,19 +425,9 @@ class CategoryFilterEngine:
                     MIN(last_accessed) as min_accessed,
                     MAX(last_accessed) as max_accessed
                 FROM categories
-            """)
+            """)[0]
 
-            row = cursor.fetchone()
-            conn.close()
-
-            return {
-                'min_created': row[0],
-                'max_created': row[1],
-                'min_updated': row[2],
-                'max_updated': row[3],
-                'min_accessed': row[4],
-                'max_accessed': row[5]
-            }
+            return row
 
         except Exception as e:
             logger.error(f"Error getting date range: {e}")
@@ -451,10 +441,7 @@ class CategoryFilterEngine:
             Diccionario con estadísticas min/max/avg
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
+            row = self._query("""
                 SELECT
                     MIN(item_count) as min_items,
                     MAX(item_count) as max_items,
@@ -466,22 +453,9 @@ class CategoryFilterEngine:
                     MAX(access_count) as max_access,
                     AVG(access_count) as avg_access
                 FROM categories
-            """)
-
-            row = cursor.fetchone()
-            conn.close()
+            """)[0]
 
-            return {
-                'min_items': int(row[0] or 0),
-                'max_items': int(row[1] or 0),
-                'avg_items': int(row[2] or 0),
-                'min_uses': int(row[3] or 0),
-                'max_uses': int(row[4] or 0),
-                'avg_uses': int(row[5] or 0),
-                'min_access': int(row[6] or 0),
-                'max_access': int(row[7] or 0),
-                'avg_access': int(row[8] or 0)
-            }
+            return {key: int(value or 0) for key, value in row.items()}
 
         except Exception as e:
             logger.error(f"Error getting popularity stats: {e}")
@@ -184,23 +184,9 @@ class ConfigManager:
             )
             logger.info(f"[ConfigManager] Category added to DB: {category.name} (ID: {cat_id}, order_index: {category.order_index})")
 
-            # Add items
-            for item in category.items:
-                item_id = self.db.add_item(
-                    category_id=cat_id,
-                    label=item.label,
-                    content=item.content,
-                    item_type=item.type.value.upper(),
-                    icon=item.icon,
-                    is_sensitive=item.is_sensitive,
-                    is_favorite=getattr(item, 'is_favorite', False),  # FIX: Add is_favorite
-                    tags=item.tags,
-                    description=item.description,
-                    working_dir=getattr(item, 'working_dir', None),
-                    color=getattr(item, 'color', None),  # FIX: Add color
-                    is_active=getattr(item, 'is_active', True),  # Add is_active (default True)
-                    is_archived=getattr(item, 'is_archived', False)  # Add is_archived (default False)
-                )
+            # Add items (single executemany transaction)
+            item_ids = self.db.add_items([self._item_to_row(item, cat_id) for item in category.items])
+            for item, item_id in zip(category.items, item_ids):
                 logger.info(f"  [ConfigManager] Item added: {item.label} (ID: {item_id})")
 
             # Clear cache
@@ -249,29 +235,11 @@ class ConfigManager:
                 is_active=updated_category.is_active
             )
 
-            # Update items (simple approach: delete all and re-add)
-            # Get existing items
-            existing_items = self.db.get_items_by_category(cat_id)
-            for existing_item in existing_items:
-                self.db.delete_item(existing_item['id'])
-
-            # Add new items
-            for item in updated_category.items:
-                self.db.add_item(
-                    category_id=cat_id,
-                    label=item.label,
-                    content=item.content,
-                    item_type=item.type.value.upper(),
-                    icon=item.icon,
-                    is_sensitive=item.is_sensitive,
-                    is_favorite=getattr(item, 'is_favorite', False),  # FIX: Add is_favorite
-                    tags=item.tags,
-                    description=item.description,
-                    working_dir=getattr(item, 'working_dir', None),
-                    color=getattr(item, 'color', None),  # FIX: Add color
-                    is_active=getattr(item, 'is_active', True),  # Add is_active (default True)
-                    is_archived=getattr(item, 'is_archived', False)  # Add is_archived (default False)
-                )
+            # Update items (simple approach: delete all and re-add), one
+            # transaction; existing rows are never read (no content/decrypt)
+            with self.db.transaction("items"):
+                self.db.delete_items_by_category(cat_id)
+                self.db.add_items([self._item_to_row(item, cat_id) for item in updated_category.items])
 
             # Clear cache
             self._categories_cache = None
@@ -414,17 +382,30 @@ class ConfigManager:
             with open(import_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            # Import settings
-            settings = data.get('settings', {})
-            for key, value in settings.items():
-                self.db.set_setting(key, value)
-
-            # Import categories
-            categories_data = data.get('categories', [])
-            for cat_data in categories_data:
-                category = Category.from_dict(cat_data)
-                if category.validate():
-                    self.add_category(category)
+            # One transaction: a failure leaves neither settings nor
+            # categories without their items behind
+            with self.db.transaction("settings", "categories", "items"):
+                # Import settings
+                settings = data.get('settings', {})
+                for key, value in settings.items():
+                    self.db.set_setting(key, value)
+
+                # Import categories; items of all categories go in one
+                # executemany (bulk_load rebuilds every items index, which
+                # only pays off when seeding an empty database)
+                item_rows = []
+                categories_data = data.get('categories', [])
+                for cat_data in categories_data:
+                    category = Category.from_dict(cat_data)
+                    if category.validate():
+                        cat_id = self.db.add_category(
+                            name=category.name,
+                            icon=category.icon,
+                            is_predefined=category.is_predefined,
+                            order_index=category.order_index
+                        )
+                        item_rows.extend(self._item_to_row(item, cat_id) for item in category.items)
+                self.db.add_items(item_rows)
 
             # Clear cache
             self._categories_cache = None
@@ -466,6 +447,10 @@ class ConfigManager:
             print(f"Error saving categories: {e}")
             return False
 
+    def invalidate_cache(self) -> None:
+        """Drop cached categories so the next get_categories() reloads from the DB"""
+        self._categories_cache = None
+
     def close(self):
         """Close database connection"""
         self.db.close()
@@ -556,6 +541,33 @@ class ConfigManager:
             'is_active': category.is_active
         }
 
+    def _item_to_row(self, item: Item, category_id: int) -> Dict:
+        """
+        Convert Item object to a DBManager.add_items row
+
+        Args:
+            item: Item object
+            category_id: Category ID
+
+        Returns:
+            Dict: Row using add_item's argument names
+        """
+        return {
+            'category_id': category_id,
+            'label': item.label,
+            'content': item.content,
+            'item_type': item.type.value.upper(),
+            'icon': item.icon,
+            'is_sensitive': item.is_sensitive,
+            'is_favorite': getattr(item, 'is_favorite', False),
+            'tags': item.tags,
+            'description': item.description,
+            'working_dir': getattr(item, 'working_dir', None),
+            'color': getattr(item, 'color', None),
+            'is_active': getattr(item, 'is_active', True),
+            'is_archived': getattr(item, 'is_archived', False)
+        }
+
     def _item_to_dict(self, item: Item, category_id: int) -> Dict:
         """
         Convert Item object to database dict
@@ -6,7 +6,7 @@ Maneja el cifrado y descifrado de datos sensibles usando AES-256 (Fernet)
 import os
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from cryptography.fernet import Fernet, InvalidToken
 from dotenv import load_dotenv, set_key
 
@@ -120,6 +120,26 @@ class EncryptionManager:
             logger.error(f"Encryption error: {e}")
             raise
 
+    def encrypt_many(self, plaintexts: List[str]) -> List[str]:
+        """
+        Encrypt several texts reusing the same cipher
+
+        Args:
+            plaintexts: Texts to encrypt
+
+        Returns:
+            List[str]: Encrypted texts (base64-encoded) in input order
+        """
+        if not self.cipher_suite:
+            raise RuntimeError("Encryption manager not initialized")
+
+        encrypt = self.cipher_suite.encrypt
+        try:
+            return [encrypt(text.encode()).decode() if text else "" for text in plaintexts]
+        except Exception as e:
+            logger.error(f"Batch encryption error: {e}")
+            raise
+
     def decrypt(self, encrypted_text: str) -> str:
         """
         Decrypt encrypted text
@@ -146,6 +166,39 @@ class EncryptionManager:
             logger.error(f"Decryption error: {e}")
             raise
 
+    def decrypt_many(self, encrypted_texts: List[str]) -> List[Optional[str]]:
+        """
+        Decrypt several texts reusing the same cipher
+
+        Unlike decrypt(), a bad token does not raise: its slot is None so
+        the caller can flag that single entry.
+
+        Args:
+            encrypted_texts: Encrypted texts (base64-encoded)
+
+        Returns:
+            List[Optional[str]]: Plaintexts in input order (None where decryption failed)
+        """
+        if not self.cipher_suite:
+            raise RuntimeError("Encryption manager not initialized")
+
+        decrypt = self.cipher_suite.decrypt
+        results: List[Optional[str]] = []
+        failed = 0
+        for encrypted_text in encrypted_texts:
+            if not encrypted_text:
+                results.append("")
+                continue
+            try:
+                results.append(decrypt(encrypted_text.encode()).decode())
+            except Exception:
+                results.append(None)
+                failed += 1
+
+        if failed:
+            logger.error(f"Batch decryption: {failed}/{len(encrypted_texts)} entries failed")
+        return results
+
     def is_encrypted(self, text: str) -> bool:
         """
         Check if text appears to be encrypted
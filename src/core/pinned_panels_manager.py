@@ -7,6 +7,8 @@ from typing import List, Dict, Optional
 import logging
 import json
 
+from utils.json_utils import loads as json_loads, dumps as json_dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,7 +44,7 @@ class PinnedPanelsManager:
 
             # Only save if there's actual filter data
             if filter_config["advanced_filters"] or filter_config["state_filter"] != "normal" or filter_config["search_text"]:
-                return json.dumps(filter_config)
+                return json_dumps(filter_config)
 
             return None
         except Exception as e:
@@ -63,7 +65,7 @@ class PinnedPanelsManager:
             return None
 
         try:
-            filter_config = json.loads(filter_config_json)
+            filter_config = json_loads(filter_config_json)
             logger.debug(f"Deserialized filter config: {filter_config}")
             return filter_config
         except json.JSONDecodeError as e:
@@ -286,6 +288,23 @@ class PinnedPanelsManager:
             logger.error(f"Failed to check panel by category: {e}")
             return None
 
+    def has_panel_for_category(self, category_id: int) -> bool:
+        """
+        Check if an active panel for this category already exists,
+        without loading its data
+
+        Args:
+            category_id: Category ID to check
+
+        Returns:
+            bool: True if an active panel exists
+        """
+        try:
+            return self.db.has_active_panel_for_category(category_id)
+        except Exception as e:
+            logger.error(f"Failed to check panel by category: {e}")
+            return False
+
     def get_all_panels(self, active_only: bool = False) -> List[Dict]:
         """
         Get all pinned panels
@@ -34,6 +34,7 @@ class SimpleBrowserManager:
         self.main_window = main_window
         self.browser_window: Optional['SimpleBrowserWindow'] = None
         self._home_url: Optional[str] = None
+        self._browser_config: Optional[dict] = None  # Caché de db.get_browser_config()
 
         # Inicializar BrowserProfileManager para persistencia de sesiones web
         from src.core.browser_profile_manager import BrowserProfileManager
@@ -62,6 +63,12 @@ class SimpleBrowserManager:
         Lazy loading: crea la instancia solo cuando se necesita
         para evitar cuelgues en el inicio de la aplicación.
         """
+        # Ya visible y con foco (p.ej. hotkey disparado dos veces): nada que hacer
+        if (self.browser_window and self.browser_window.isVisible()
+                and self.browser_window.isActiveWindow()):
+            logger.debug("Navegador ya visible y activo")
+            return
+
         # Lazy loading - crear solo cuando se necesita
         if not self.browser_window:
             logger.info("Creando nueva instancia de SimpleBrowserWindow")
@@ -69,8 +76,8 @@ class SimpleBrowserManager:
             # Import aquí para evitar circular imports y lazy loading
             from src.views.simple_browser_window import SimpleBrowserWindow
 
-            # Cargar configuración completa desde DB
-            config = self.db.get_browser_config()
+            # Cargar configuración completa (cacheada)
+            config = self._get_browser_config()
             home_url = config.get('home_url', 'https://www.google.com')
             width = config.get('width', 500)
             height = config.get('height', 700)
@@ -99,7 +106,8 @@ class SimpleBrowserManager:
         self.browser_window.activateWindow()
 
         # Registrar como AppBar para reservar espacio en el escritorio
-        self.browser_window.register_appbar()
+        if not self.browser_window.appbar_registered:
+            self.browser_window.register_appbar()
 
         logger.info("Navegador mostrado")
 
@@ -161,8 +169,8 @@ class SimpleBrowserManager:
             return self._home_url
 
         try:
-            # Intentar cargar desde base de datos
-            config = self.db.get_browser_config()
+            # Intentar cargar desde base de datos (cacheada)
+            config = self._get_browser_config()
             if config and 'home_url' in config:
                 self._home_url = config['home_url']
                 logger.info(f"URL home cargada desde DB: {self._home_url}")
@@ -178,6 +186,33 @@ class SimpleBrowserManager:
 
         return self._home_url
 
+    def _get_browser_config(self) -> dict:
+        """
+        Obtiene la configuración del navegador, leyéndola de la DB solo la primera vez.
+
+        Returns:
+            Dict con home_url, is_visible, width, height
+        """
+        if self._browser_config is None:
+            self._browser_config = self.db.get_browser_config()
+        return self._browser_config
+
+    def save_browser_config(self, config: dict) -> bool:
+        """
+        Guarda la configuración del navegador y descarta la copia cacheada.
+
+        Todas las escrituras de browser_config deben pasar por aquí para que
+        _get_browser_config no devuelva valores viejos.
+
+        Args:
+            config: Dict con home_url, is_visible, width, height
+
+        Returns:
+            bool: True si se guardó correctamente
+        """
+        self._browser_config = None
+        return self.db.save_browser_config(config)
+
     def save_home_url(self, url: str):
         """
         Guarda la URL home en la configuración.
@@ -187,7 +222,7 @@ class SimpleBrowserManager:
         """
         try:
             self._home_url = url
-            self.db.save_browser_config({'home_url': url})
+            self.save_browser_config({'home_url': url})
             logger.info(f"URL home guardada: {url}")
 
         except Exception as e:
@@ -1,46 +1,479 @@
 """
 Database Manager for Widget Sidebar
 Manages SQLite database operations for settings, categories, items, and clipboard history
+
+File databases run in WAL mode with synchronous=NORMAL (see CONNECTION_PRAGMAS):
+commits do not wait for an fsync, so a power loss or OS crash can roll back the
+last few committed transactions. The database itself cannot be corrupted that
+way, and an application crash loses nothing that was committed.
 """
 
+import os
+import re
+import queue
 import sqlite3
 import json
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import defaultdict
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Set, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
+
+from utils.json_utils import loads as _json_loads, dumps as _json_dumps
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection tuning applied once per new connection.
+# WAL lets readers run alongside the writer and amortizes fsyncs;
+# 64 MB page cache + 256 MB mmap keep this small DB off the disk for reads.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+    # Truncate the WAL back to 64 MB after checkpoints instead of letting it
+    # keep the size of the largest write burst
+    "PRAGMA journal_size_limit = 67108864",
+)
+# journal_mode/mmap_size make no sense for :memory: databases
+MEMORY_DB_PRAGMAS = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+)
+# Read-only pool connections (journal mode is a property of the file, set by the writer)
+READER_PRAGMAS = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Settings seeded on schema creation (key, JSON-encoded value);
+# existing keys are never overwritten
+DEFAULT_SETTINGS = (
+    ('theme', '"dark"'),
+    ('panel_width', '300'),
+    ('sidebar_width', '70'),
+    ('hotkey', '"ctrl+shift+v"'),
+    ('always_on_top', 'true'),
+    ('start_with_windows', 'false'),
+    ('animation_speed', '300'),
+    ('opacity', '0.95'),
+    ('max_history', '20'),
+    ('prewarm_browser', 'false'),
+)
+
+# Stored in PRAGMA user_version once the schema below (tables, indexes, FTS,
+# data fixes) has been applied. Bump it whenever _upgrade_schema gains work.
+SCHEMA_VERSION = 1
+
+# Size of each connection's prepared-statement LRU (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+# Hot-path SQL, kept as constants so every call hands sqlite3 the same text
+# and hits the connection's prepared-statement cache
+GET_SETTING_SQL = "SELECT value FROM settings WHERE key = ?"
+SET_SETTING_SQL = """
+    INSERT INTO settings (key, value, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = CURRENT_TIMESTAMP
+"""
+GET_CATEGORY_SQL = "SELECT * FROM categories WHERE id = ?"
+GET_ITEM_SQL = "SELECT * FROM items WHERE id = ?"
+INSERT_ITEM_PREFIX = """
+    INSERT INTO items
+    (category_id, label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista, updated_at)
+    VALUES """
+INSERT_ITEM_VALUES = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"
+# Rows per multi-row INSERT: stays under SQLite's historical 999
+# bound-parameter limit (16 parameters per item row)
+ITEMS_PER_INSERT = 999 // INSERT_ITEM_VALUES.count("?")
+REORDER_LIST_ITEM_SQL = """
+    UPDATE items
+    SET orden_lista = CASE
+        WHEN id = :id THEN :new
+        WHEN :new < :old THEN orden_lista + 1
+        ELSE orden_lista - 1
+    END
+    WHERE category_id = :cat
+    AND list_group = :lg
+    AND is_list = 1
+    AND orden_lista BETWEEN min(:new, :old) AND max(:new, :old)
+"""
+LIST_NAME_TAKEN_SQL = """
+    SELECT EXISTS (
+        SELECT 1 FROM items
+        WHERE category_id = ?
+        AND list_group = ?
+        AND is_list = 1
+        AND list_group IS NOT ?
+    ) AS taken
+"""
+# Same reflow as REORDER_LIST_ITEM_SQL, over the whole speed dial grid
+REORDER_SPEED_DIAL_SQL = """
+    UPDATE speed_dials
+    SET position = CASE
+        WHEN id = :id THEN :new
+        WHEN :new < :old THEN position + 1
+        ELSE position - 1
+    END
+    WHERE position BETWEEN min(:new, :old) AND max(:new, :old)
+"""
+REORDER_SPEED_DIALS_SQL = """
+    UPDATE speed_dials SET position = ranked.new_position
+    FROM (
+        SELECT id, ROW_NUMBER() OVER (ORDER BY position, id) - 1 AS new_position
+        FROM speed_dials
+    ) AS ranked
+    WHERE speed_dials.id = ranked.id AND speed_dials.position IS NOT ranked.new_position
+"""
+INSERT_SESSION_TABS_SQL = """
+    INSERT INTO session_tabs (session_id, url, title, position, is_active)
+    SELECT ?, json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+           json_extract(value, '$[2]'), json_extract(value, '$[3]')
+    FROM json_each(?)
+"""
+SEED_SETTING_SQL = "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)"
+UPDATE_LAST_USED_SQL = "UPDATE items SET last_used = ? WHERE id = ?"
+UPDATE_PANEL_STATS_SQL = (
+    "UPDATE pinned_panels SET open_count = open_count + ?, last_opened = ? WHERE id = ?"
+)
+
+# update_last_used() and update_panel_last_opened() buffer their writes and
+# flush them in one batch this long after the first pending one (or on close)
+LAST_USED_FLUSH_SECONDS = 2.0
+
+# Non-unique indexes on items (same definitions as _create_database).
+# bulk_load() drops them while inserting and rebuilds each once at the end.
+ITEMS_SECONDARY_INDEXES = {
+    "idx_items_category": "CREATE INDEX IF NOT EXISTS idx_items_category ON items(category_id)",
+    "idx_items_last_used": "CREATE INDEX IF NOT EXISTS idx_items_last_used ON items(last_used DESC)",
+    "idx_items_is_list": "CREATE INDEX IF NOT EXISTS idx_items_is_list ON items(is_list) WHERE is_list = 1",
+    "idx_items_list_group": "CREATE INDEX IF NOT EXISTS idx_items_list_group ON items(list_group) WHERE list_group IS NOT NULL",
+    "idx_items_orden_lista": "CREATE INDEX IF NOT EXISTS idx_items_orden_lista ON items(category_id, list_group, orden_lista) WHERE is_list = 1",
+}
+
+# Full-text index over items (label, content, tags), kept in sync by triggers.
+# trigram tokenizer = case-insensitive substring matching, like the old LIKE '%q%'.
+# Sensitive content is stored encrypted, so it is indexed as '' (never searchable).
+ITEMS_FTS_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+        label, content, tags,
+        content='items', content_rowid='id', tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO items_fts(rowid, label, content, tags)
+        VALUES (new.id, new.label, CASE WHEN new.is_sensitive THEN '' ELSE new.content END, new.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, label, content, tags)
+        VALUES ('delete', old.id, old.label, CASE WHEN old.is_sensitive THEN '' ELSE old.content END, old.tags);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_fts_au AFTER UPDATE OF label, content, tags, is_sensitive ON items BEGIN
+        INSERT INTO items_fts(items_fts, rowid, label, content, tags)
+        VALUES ('delete', old.id, old.label, CASE WHEN old.is_sensitive THEN '' ELSE old.content END, old.tags);
+        INSERT INTO items_fts(rowid, label, content, tags)
+        VALUES (new.id, new.label, CASE WHEN new.is_sensitive THEN '' ELSE new.content END, new.tags);
+    END;
+"""
+# categories.item_count kept equal to the number of items in the category
+CATEGORY_ITEM_COUNT_SQL = """
+    CREATE TRIGGER IF NOT EXISTS items_count_ai AFTER INSERT ON items BEGIN
+        UPDATE categories SET item_count = item_count + 1 WHERE id = new.category_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_count_ad AFTER DELETE ON items BEGIN
+        UPDATE categories SET item_count = item_count - 1 WHERE id = old.category_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS items_count_au AFTER UPDATE OF category_id ON items
+    WHEN old.category_id IS NOT new.category_id BEGIN
+        UPDATE categories SET item_count = item_count - 1 WHERE id = old.category_id;
+        UPDATE categories SET item_count = item_count + 1 WHERE id = new.category_id;
+    END;
+"""
+# Tables that triggers/ON DELETE CASCADE also write when the key table is
+# written (query cache invalidation)
+_TRIGGER_WRITES = {"items": ("categories",), "browser_sessions": ("session_tabs",)}
+
+# Shortest query the trigram index can answer; shorter ones fall back to LIKE
+FTS_MIN_QUERY_LENGTH = 3
+
+# Table written by an INSERT/UPDATE/DELETE/REPLACE statement (for query cache invalidation)
+_WRITE_TARGET_RE = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+(\w+)",
+    re.IGNORECASE
+)
+# Pseudo-table bumped by transaction(): its writes are not parsed, so they invalidate everything
+_ANY_TABLE = "*"
+# Entries kept by the query result cache before it is flushed
+QUERY_CACHE_MAX_ENTRIES = 256
+# Table versions shared by every DBManager on the same file (resolved path ->
+# table -> version), so a write through one instance invalidates the others
+_SHARED_TABLE_VERSIONS: Dict[str, Dict[str, int]] = {}
+_SHARED_TABLE_VERSIONS_LOCK = threading.Lock()
+
+
+def _parse_tags(raw: Optional[str]) -> List[str]:
+    """
+    Parse the items.tags column
+
+    Tags are stored as a JSON array; legacy CSV values are rewritten to JSON
+    by DBManager._migrate_legacy_tags, so the CSV branch is only a fallback
+    and never goes through a JSONDecodeError.
+
+    Args:
+        raw: Raw column value
+
+    Returns:
+        List[str]: Tags (a new list on every call; callers may mutate it)
+    """
+    if not raw or raw == 'null':
+        return []
+    return list(_parse_tags_cached(raw))
+
+
+@lru_cache(maxsize=4096)
+def _parse_tags_cached(raw: str) -> Tuple[str, ...]:
+    """_parse_tags for a non-empty value; the same tag strings repeat across items"""
+    if raw[0] == '[':
+        try:
+            return tuple(_json_loads(raw))
+        except json.JSONDecodeError:
+            pass
+    return tuple(filter(None, map(str.strip, raw.strip('[]').split(','))))
+
+
+def _parse_item_tags(items: List[Dict]) -> None:
+    """Replace each item's raw 'tags' column with the parsed list, in place"""
+    parse = _parse_tags  # local name: one global lookup per batch, not per row
+    for item in items:
+        item['tags'] = parse(item['tags'])
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """
+    Fetch all rows of a tuple-row cursor as dicts
+
+    Column names are read from cursor.description once per query instead of
+    going through a sqlite3.Row per row only to copy it into a dict.
+
+    Args:
+        cursor: Executed cursor with row_factory = None
+
+    Returns:
+        List[Dict]: Rows keyed by column name
+    """
+    rows = cursor.fetchall()
+    if not rows:
+        return []
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+@lru_cache(maxsize=128)
+def _build_multi_insert_sql(rows: int, returning: bool = False) -> str:
+    """INSERT INTO items ... VALUES (...), (...), ... with ``rows`` value groups"""
+    sql = INSERT_ITEM_PREFIX + ", ".join([INSERT_ITEM_VALUES] * rows)
+    return sql + " RETURNING id" if returning else sql
+
+
+@lru_cache(maxsize=256)
+def _build_update_sql(table: str, fields: Tuple[str, ...], touch_updated_at: bool = True) -> str:
+    """UPDATE ... SET <fields>[, updated_at] WHERE id = ?, memoized per column set"""
+    assignments = ", ".join(f"{field} = ?" for field in fields)
+    if touch_updated_at:
+        assignments += ", updated_at = CURRENT_TIMESTAMP"
+    return f"UPDATE {table} SET {assignments} WHERE id = ?"
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
-    def __init__(self, db_path: str = "widget_sidebar.db"):
+    def __init__(self, db_path: str = "widget_sidebar.db", reader_pool_size: Optional[int] = None):
         """
         Initialize database manager
 
         Args:
             db_path: Path to SQLite database file
+            reader_pool_size: Max read-only connections for execute_query
+                              (default: os.cpu_count())
         """
         self.db_path = Path(db_path)
-        self.connection = None
+        self.connection = None  # Writer connection (also used for :memory: reads)
+        self._is_memory_db = str(self.db_path) == ":memory:"
+        # Read-only connections, opened on demand up to _reader_pool_size
+        self._reader_pool_size = max(1, reader_pool_size or os.cpu_count() or 1)
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._all_readers: List[sqlite3.Connection] = []
+        # One tuple-row cursor per reader, reused by execute_query (a reader
+        # is only ever used by the thread that checked it out)
+        self._reader_cursors: Dict[sqlite3.Connection, sqlite3.Cursor] = {}
+        self._readers_lock = threading.Lock()
+        # Serializes write transactions on the shared writer connection
+        # (the last_used flush runs on a timer thread)
+        self._write_lock = threading.RLock()
+        self._tx_depth = 0  # transaction() nesting level on the writer
+        self._tx_owner: Optional[int] = None  # thread id running the open transaction()
+        self._tx_tables: Set[str] = set()  # tables written by the open transaction()
+        # item_id -> last_used timestamp not yet written (see update_last_used)
+        self._last_used_pending: Dict[int, str] = {}
+        self._last_used_lock = threading.Lock()
+        self._last_used_timer: Optional[threading.Timer] = None
+        # panel_id -> [opens not yet written, latest last_opened]
+        # (see update_panel_last_opened)
+        self._panel_stats_pending: Dict[int, list] = {}
+        self._panel_stats_lock = threading.Lock()
+        self._panel_stats_timer: Optional[threading.Timer] = None
+        # Single background thread for heavy reads requested from the UI
+        # (see submit); the worker is started on first use
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite-io')
+        # Result cache for read-mostly getters: key -> (tables, rows).
+        # Keys embed the table versions, bumped on every write to that table;
+        # the versions are shared with other instances on the same file.
+        self._qcache: Dict[tuple, Tuple[Tuple[str, ...], List[Dict]]] = {}
+        self._qcache_lock = threading.Lock()
+        if self._is_memory_db:
+            self._table_versions: Dict[str, int] = defaultdict(int)
+        else:
+            with _SHARED_TABLE_VERSIONS_LOCK:
+                self._table_versions = _SHARED_TABLE_VERSIONS.setdefault(
+                    str(self.db_path.resolve()), defaultdict(int)
+                )
+        self._enc = None  # EncryptionManager, created on first use (see enc)
+        self._fts_enabled = False  # items_fts available (SQLite built with FTS5)
+        self._history_count: Optional[int] = None  # clipboard_history rows, counted on first trim
         self._ensure_database()
         logger.info(f"Database initialized at: {self.db_path}")
 
+    @property
+    def enc(self):
+        """
+        Shared EncryptionManager (created on first use)
+
+        Returns:
+            EncryptionManager: Encryption manager for sensitive item content
+        """
+        if self._enc is None:
+            from core.encryption_manager import EncryptionManager
+            self._enc = EncryptionManager()
+        return self._enc
+
     def _ensure_database(self):
-        """Create database and tables if they don't exist"""
-        # Check if it's an in-memory database or file doesn't exist
-        is_memory_db = str(self.db_path) == ":memory:"
-        if is_memory_db or not self.db_path.exists():
-            logger.info("Creating new database...")
+        """Create or upgrade the schema unless PRAGMA user_version says it is current"""
+        conn = self.connect()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            if version > SCHEMA_VERSION:
+                logger.warning(f"Database schema v{version} is newer than this app (v{SCHEMA_VERSION})")
+            self._fts_enabled = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+            ).fetchone() is not None
+            logger.debug(f"Database schema up to date (v{version})")
+            return
+
+        if self._upgrade_schema(version):
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+
+    def _upgrade_schema(self, from_version: int):
+        """
+        Bring a database at ``from_version`` up to SCHEMA_VERSION
+
+        Every step is idempotent, so pre-versioning databases (user_version 0)
+        simply run all of them.
+
+        Args:
+            from_version: Current PRAGMA user_version (0 = new or unversioned DB)
+
+        Returns:
+            bool: True if every step succeeded (the version may be recorded)
+        """
+        logger.info(f"Preparing database schema (v{from_version} -> v{SCHEMA_VERSION})...")
+        complete = True
+        try:
+            # Tables/indexes/default settings (CREATE ... IF NOT EXISTS, INSERT OR IGNORE)
             self._create_database()
-        else:
-            logger.info("Database already exists")
+        except sqlite3.Error as e:
+            # Old databases may lack columns the indexes need until the
+            # migrate_*.py scripts run; retry on next start
+            logger.warning(f"Schema DDL incomplete, will retry on next start: {e}")
+            complete = False
+        self._migrate_legacy_tags()
+        self._ensure_search_index()
+        try:
+            self._ensure_item_count_triggers()
+        except sqlite3.Error as e:
+            logger.warning(f"Category item_count triggers not installed, will retry on next start: {e}")
+            complete = False
+        return complete
+
+    def _ensure_item_count_triggers(self):
+        """Create the categories.item_count triggers if missing, recounting existing items"""
+        conn = self.connect()
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'items_count_ai'"
+        ).fetchone()
+        if exists:
+            return
+        with self.transaction() as tx:
+            for statement in CATEGORY_ITEM_COUNT_SQL.split(";\n\n"):
+                tx.execute(statement)
+            tx.execute("""
+                UPDATE categories
+                SET item_count = (SELECT COUNT(*) FROM items WHERE items.category_id = categories.id)
+            """)
+        logger.info("Category item_count triggers created")
+
+    def _ensure_search_index(self):
+        """Create items_fts and its triggers if missing, indexing existing items"""
+        conn = self.connect()
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+            ).fetchone()
+            if not exists:
+                with self.transaction() as tx:
+                    for statement in ITEMS_FTS_SQL.split(";\n\n"):
+                        tx.execute(statement)
+                    tx.execute("""
+                        INSERT INTO items_fts(rowid, label, content, tags)
+                        SELECT id, label, CASE WHEN is_sensitive THEN '' ELSE content END, tags
+                        FROM items
+                    """)
+                logger.info("Full-text search index created")
+            self._fts_enabled = True
+        except sqlite3.Error as e:
+            # FTS5 missing from this SQLite build: search_items keeps using LIKE
+            logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+
+    def _migrate_legacy_tags(self):
+        """Rewrite legacy CSV items.tags values as JSON arrays"""
+        try:
+            rows = self.execute_query(
+                "SELECT id, tags FROM items WHERE tags IS NOT NULL AND tags != '' AND NOT json_valid(tags)"
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Legacy tags check skipped: {e}")
+            return
+        if rows:
+            self.execute_many(
+                "UPDATE items SET tags = ? WHERE id = ?",
+                [(_json_dumps(_parse_tags(row['tags'])), row['id']) for row in rows]
+            )
+            logger.info(f"Migrated {len(rows)} legacy CSV tag values to JSON")
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -50,39 +483,161 @@ class DBManager:
             sqlite3.Connection: Database connection
         """
         if self.connection is None:
-            self.connection = sqlite3.connect(
+            conn = sqlite3.connect(
                 self.db_path,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=CACHED_STATEMENTS
+            )
+            # Foreign keys + journal/cache tuning
+            self._configure_connection(
+                conn, ("PRAGMA foreign_keys = ON",)
+                + (MEMORY_DB_PRAGMAS if self._is_memory_db else CONNECTION_PRAGMAS)
             )
-            self.connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self.connection.execute("PRAGMA foreign_keys = ON")
+            self.connection = conn
         return self.connection
 
+    def analyze(self) -> None:
+        """
+        Gather planner statistics for all tables and indexes
+
+        Meant for after large one-time loads (first-run seed, imports);
+        the result persists in sqlite_stat1.
+        """
+        with self.transaction() as conn:
+            conn.execute("ANALYZE")
+        logger.info("Database statistics updated (ANALYZE)")
+
+    def optimize(self) -> None:
+        """
+        Run PRAGMA optimize on the writer connection
+
+        Re-analyzes only tables whose statistics are stale for the queries
+        this connection ran; cheap and usually a no-op. Called on close and
+        periodically by MainController. Errors are logged, never raised.
+        """
+        if self.connection is None:
+            return
+        try:
+            with self._write_lock:
+                self.connection.execute("PRAGMA optimize")
+            logger.debug("PRAGMA optimize done")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+
+    @staticmethod
+    def _configure_connection(conn: sqlite3.Connection, pragmas: Tuple[str, ...]) -> None:
+        """
+        Apply row factory and PRAGMAs to a freshly opened connection
+
+        Only called where a connection is created, so each connection is
+        configured exactly once; later connect() calls return it untouched.
+        """
+        conn.row_factory = sqlite3.Row
+        for pragma in pragmas:
+            conn.execute(pragma)
+
     def close(self):
         """Close database connection"""
+        # Let the running background read finish before its connection goes
+        # away; a fresh executor keeps submit() usable if the DB is reopened
+        self._io_executor.shutdown(wait=True, cancel_futures=True)
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite-io')
+        self.flush_last_used()
+        self.flush_panel_stats()
+        with self._readers_lock:
+            for reader in self._all_readers:
+                reader.close()
+            self._all_readers.clear()
+            self._reader_cursors.clear()
+            self._readers = queue.Queue()
         if self.connection:
+            # Refresh planner statistics (sqlite_stat1) for tables whose
+            # shape changed this session
+            self.optimize()
             self.connection.close()
             self.connection = None
             logger.info("Database connection closed")
 
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file"""
+        uri = self.db_path.resolve().as_uri() + "?mode=ro"
+        reader = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                 cached_statements=CACHED_STATEMENTS)
+        self._configure_connection(reader, READER_PRAGMAS)
+        cursor = reader.cursor()
+        cursor.row_factory = None
+        self._reader_cursors[reader] = cursor
+        return reader
+
     @contextmanager
-    def transaction(self):
+    def _checkout_reader(self):
+        """
+        Borrow a read-only connection from the pool
+
+        Falls back to the writer for :memory: databases (a second connection
+        would see a different DB) and for reads issued from inside an open
+        transaction() on the same thread, so they see its uncommitted changes.
+        Other threads keep reading the last committed state from the pool.
+        """
+        writer = self.connect()  # also makes sure the WAL files exist for readers
+        if self._is_memory_db or self._tx_owner == threading.get_ident():
+            yield writer
+            return
+
+        try:
+            reader = self._readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                can_open = len(self._all_readers) < self._reader_pool_size
+                if can_open:
+                    reader = self._open_reader()
+                    self._all_readers.append(reader)
+            if not can_open:
+                reader = self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
+    @contextmanager
+    def transaction(self, *tables: str):
         """
         Context manager for database transactions
 
         Usage:
             with db.transaction() as conn:
                 conn.execute(...)
+
+        Args:
+            *tables: Tables written inside the block; only cached results
+                     reading them are dropped. None = drop the whole cache.
         """
-        conn = self.connect()
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Transaction failed: {e}")
-            raise
+        with self._write_lock:
+            conn = self.connect()
+            self._tx_tables.update(tables or (_ANY_TABLE,))
+            if self._tx_depth:
+                # Nested: the outermost transaction() commits or rolls back
+                self._tx_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._tx_depth -= 1
+                return
+
+            self._tx_depth = 1
+            self._tx_owner = threading.get_ident()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Transaction failed: {e}")
+                raise
+            finally:
+                self._tx_depth = 0
+                self._tx_owner = None
+                written, self._tx_tables = self._tx_tables, set()
+                self._invalidate_tables(*written)
 
     def _create_database(self):
         """Create database schema with all tables and indices"""
@@ -222,25 +777,17 @@ class DBManager:
             CREATE INDEX IF NOT EXISTS idx_pinned_active ON pinned_panels(is_active);
             CREATE INDEX IF NOT EXISTS idx_bookmarks_order ON bookmarks(order_index);
             CREATE INDEX IF NOT EXISTS idx_bookmarks_url ON bookmarks(url);
+            CREATE INDEX IF NOT EXISTS idx_bookmarks_folder_order ON bookmarks(folder, order_index);
             CREATE INDEX IF NOT EXISTS idx_speed_dials_position ON speed_dials(position);
             -- Índices para listas avanzadas
             CREATE INDEX IF NOT EXISTS idx_items_is_list ON items(is_list) WHERE is_list = 1;
             CREATE INDEX IF NOT EXISTS idx_items_list_group ON items(list_group) WHERE list_group IS NOT NULL;
             CREATE INDEX IF NOT EXISTS idx_items_orden_lista ON items(category_id, list_group, orden_lista) WHERE is_list = 1;
-
-            -- Configuración inicial por defecto
-            INSERT OR IGNORE INTO settings (key, value) VALUES
-                ('theme', '"dark"'),
-                ('panel_width', '300'),
-                ('sidebar_width', '70'),
-                ('hotkey', '"ctrl+shift+v"'),
-                ('always_on_top', 'true'),
-                ('start_with_windows', 'false'),
-                ('animation_speed', '300'),
-                ('opacity', '0.95'),
-                ('max_history', '20');
         """)
 
+        # Configuración inicial por defecto
+        cursor.executemany(SEED_SETTING_SQL, DEFAULT_SETTINGS)
+
         conn.commit()
         # Don't close the connection - it's managed by self.connection
         logger.info("Database schema created successfully")
@@ -257,40 +804,167 @@ class DBManager:
             List[Dict]: Query results
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            with self._checkout_reader() as conn:
+                # fetchall() in _fetch_dicts runs the statement to completion,
+                # so the reused cursor never holds a read snapshot open
+                cursor = self._reader_cursors.get(conn)
+                if cursor is None:  # writer (:memory: / open transaction)
+                    cursor = conn.cursor()
+                    cursor.row_factory = None
+                cursor.execute(query, params)
+                return _fetch_dicts(cursor)
         except sqlite3.Error as e:
             logger.error(f"Query execution failed: {e}")
             logger.error(f"Query: {query}")
             logger.error(f"Params: {params}")
             raise
 
-    def execute_update(self, query: str, params: tuple = ()) -> int:
+    def execute_scalar(self, query: str, params: tuple = (), default: Any = None) -> Any:
         """
-        Execute INSERT/UPDATE/DELETE query
+        Execute SELECT query and return the first column of the first row
+
+        For COUNT/EXISTS style lookups: reads a single tuple row instead of
+        building a dict list only to index [0]['column'].
 
         Args:
             query: SQL query string
             params: Query parameters tuple
+            default: Value returned when the query yields no rows
 
         Returns:
-            int: Last row ID for INSERT, or number of affected rows
+            Any: First column value, or ``default``
         """
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor.lastrowid
+            with self._checkout_reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                row = cursor.execute(query, params).fetchone()
+                return row[0] if row else default
         except sqlite3.Error as e:
-            logger.error(f"Update execution failed: {e}")
+            logger.error(f"Query execution failed: {e}")
             logger.error(f"Query: {query}")
             logger.error(f"Params: {params}")
             raise
 
+    def _cached_query(self, query: str, params: tuple, tables: Tuple[str, ...]) -> List[Dict]:
+        """
+        execute_query with an in-process result cache
+
+        Results are reused until a write touches one of ``tables``
+        (see _invalidate_tables). Rows are handed out as fresh dicts, so
+        callers may mutate them.
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+            tables: Tables the query reads from
+
+        Returns:
+            List[Dict]: Query results
+        """
+        if self._tx_owner == threading.get_ident():
+            # Uncommitted rows must not leak to other threads via the cache
+            return self.execute_query(query, params)
+        versions = tuple(self._table_versions.get(t, 0) for t in tables + (_ANY_TABLE,))
+        key = (query, params, versions)
+        with self._qcache_lock:
+            cached = self._qcache.get(key)
+        if cached is None:
+            rows = self.execute_query(query, params)
+            with self._qcache_lock:
+                if len(self._qcache) >= QUERY_CACHE_MAX_ENTRIES:
+                    self._qcache.clear()
+                self._qcache[key] = (tables, rows)
+        else:
+            rows = cached[1]
+        return [dict(row) for row in rows]
+
+    def _invalidate_tables(self, *tables: str) -> None:
+        """Bump table versions and drop cached results that read them"""
+        tables += tuple(t for table in tables for t in _TRIGGER_WRITES.get(table, ()))
+        with _SHARED_TABLE_VERSIONS_LOCK:
+            for table in tables:
+                self._table_versions[table] += 1
+        with self._qcache_lock:
+            if _ANY_TABLE in tables:
+                self._qcache.clear()
+                return
+            stale = [key for key, (deps, _) in self._qcache.items()
+                     if any(t in deps for t in tables)]
+            for key in stale:
+                del self._qcache[key]
+
+    def execute_update(self, query: str, params: tuple = ()) -> int:
+        """
+        Execute INSERT/UPDATE/DELETE query
+
+        Args:
+            query: SQL query string
+            params: Query parameters tuple
+
+        Inside a transaction() block the statement joins that transaction:
+        the outermost block commits (or rolls back) and invalidates.
+
+        Returns:
+            int: Last row ID for INSERT, or number of affected rows
+        """
+        with self._write_lock:
+            try:
+                conn = self.connect()
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                if not self._tx_depth:
+                    conn.commit()
+                return cursor.lastrowid
+            except sqlite3.Error as e:
+                logger.error(f"Update execution failed: {e}")
+                logger.error(f"Query: {query}")
+                logger.error(f"Params: {params}")
+                raise
+            finally:
+                self._statement_written(query)
+
+    def execute_returning(self, query: str, params: tuple = ()) -> List[Dict]:
+        """
+        Execute INSERT/UPDATE/DELETE ... RETURNING query
+
+        Args:
+            query: SQL query string with a RETURNING clause
+            params: Query parameters tuple
+
+        Joins an open transaction() like execute_update.
+
+        Returns:
+            List[Dict]: Rows produced by the RETURNING clause
+        """
+        with self._write_lock:
+            try:
+                conn = self.connect()
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                # RETURNING rows must be consumed before the statement can complete
+                rows = _fetch_dicts(cursor)
+                if not self._tx_depth:
+                    conn.commit()
+                return rows
+            except sqlite3.Error as e:
+                logger.error(f"Update execution failed: {e}")
+                logger.error(f"Query: {query}")
+                logger.error(f"Params: {params}")
+                raise
+            finally:
+                self._statement_written(query)
+
+    def _statement_written(self, query: str) -> None:
+        """Invalidate the table a write statement targets, or defer to the open transaction()"""
+        match = _WRITE_TARGET_RE.match(query)
+        table = match.group(1).lower() if match else _ANY_TABLE
+        if self._tx_depth:
+            self._tx_tables.add(table)
+        else:
+            self._invalidate_tables(table)
+
     def execute_many(self, query: str, params_list: List[tuple]) -> None:
         """
         Execute multiple INSERT queries in a single transaction
@@ -308,6 +982,23 @@ class DBManager:
             logger.error(f"Batch execution failed: {e}")
             raise
 
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Run a DBManager call on the sqlite-io background thread
+
+        Reads there go through the reader pool, so they overlap with writes
+        from the UI thread (WAL). Callers poll/attach a done-callback and
+        must hand results back to the UI thread themselves.
+
+        Args:
+            fn: Callable to run (usually a bound DBManager method)
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Future: Resolves to fn's return value (or its exception)
+        """
+        return self._io_executor.submit(fn, *args, **kwargs)
+
     # ========== SETTINGS ==========
 
     def get_setting(self, key: str, default: Any = None) -> Any:
@@ -321,11 +1012,10 @@ class DBManager:
         Returns:
             Any: Setting value (parsed from JSON)
         """
-        query = "SELECT value FROM settings WHERE key = ?"
-        result = self.execute_query(query, (key,))
+        result = self._cached_query(GET_SETTING_SQL, (key,), ("settings",))
         if result:
             try:
-                return json.loads(result[0]['value'])
+                return _json_loads(result[0]['value'])
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse setting '{key}': {e}")
                 return default
@@ -339,15 +1029,8 @@ class DBManager:
             key: Setting key
             value: Setting value (will be JSON encoded)
         """
-        value_json = json.dumps(value)
-        query = """
-            INSERT INTO settings (key, value, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(key) DO UPDATE SET
-                value = excluded.value,
-                updated_at = CURRENT_TIMESTAMP
-        """
-        self.execute_update(query, (key, value_json))
+        value_json = _json_dumps(value)
+        self.execute_update(SET_SETTING_SQL, (key, value_json))
         logger.debug(f"Setting saved: {key} = {value}")
 
     def get_all_settings(self) -> Dict[str, Any]:
@@ -358,11 +1041,11 @@ class DBManager:
             Dict[str, Any]: Dictionary of all settings
         """
         query = "SELECT key, value FROM settings"
-        results = self.execute_query(query)
+        results = self._cached_query(query, (), ("settings",))
         settings = {}
         for row in results:
             try:
-                settings[row['key']] = json.loads(row['value'])
+                settings[row['key']] = _json_loads(row['value'])
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse setting '{row['key']}': {e}")
         return settings
@@ -384,7 +1067,19 @@ class DBManager:
             WHERE is_active = 1 OR ? = 1
             ORDER BY order_index
         """
-        return self.execute_query(query, (include_inactive,))
+        return self._cached_query(query, (include_inactive,), ("categories",))
+
+    def get_category_counts(self) -> Dict[int, int]:
+        """
+        Get the number of items in each category
+
+        Reads categories.item_count, which triggers keep up to date.
+
+        Returns:
+            Dict[int, int]: category_id -> item count
+        """
+        rows = self._cached_query("SELECT id, item_count FROM categories", (), ("categories",))
+        return {row['id']: row['item_count'] for row in rows}
 
     def get_category(self, category_id: int) -> Optional[Dict]:
         """
@@ -396,8 +1091,7 @@ class DBManager:
         Returns:
             Optional[Dict]: Category dictionary or None
         """
-        query = "SELECT * FROM categories WHERE id = ?"
-        result = self.execute_query(query, (category_id,))
+        result = self._cached_query(GET_CATEGORY_SQL, (category_id,), ("categories",))
         return result[0] if result else None
 
     def add_category(self, name: str, icon: str = None,
@@ -414,18 +1108,16 @@ class DBManager:
         Returns:
             int: New category ID
         """
-        # Use provided order_index or calculate next one
-        if order_index is None:
-            max_order = self.execute_query(
-                "SELECT MAX(order_index) as max_order FROM categories"
-            )
-            order_index = (max_order[0]['max_order'] or 0) + 1
-
+        # Use provided order_index or the next one, computed in the same statement
         query = """
             INSERT INTO categories (name, icon, order_index, is_predefined, updated_at)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            VALUES (?, ?,
+                    COALESCE(?, (SELECT COALESCE(MAX(order_index), 0) + 1 FROM categories)),
+                    ?, CURRENT_TIMESTAMP)
+            RETURNING id, order_index
         """
-        category_id = self.execute_update(query, (name, icon, order_index, is_predefined))
+        row = self.execute_returning(query, (name, icon, order_index, is_predefined))[0]
+        category_id, order_index = row['id'], row['order_index']
         logger.info(f"Category added: {name} (ID: {category_id}, order_index: {order_index})")
         return category_id
 
@@ -446,22 +1138,21 @@ class DBManager:
         params = []
 
         if name is not None:
-            updates.append("name = ?")
+            updates.append("name")
             params.append(name)
         if icon is not None:
-            updates.append("icon = ?")
+            updates.append("icon")
             params.append(icon)
         if order_index is not None:
-            updates.append("order_index = ?")
+            updates.append("order_index")
             params.append(order_index)
         if is_active is not None:
-            updates.append("is_active = ?")
+            updates.append("is_active")
             params.append(is_active)
 
         if updates:
-            updates.append("updated_at = CURRENT_TIMESTAMP")
             params.append(category_id)
-            query = f"UPDATE categories SET {', '.join(updates)} WHERE id = ?"
+            query = _build_update_sql("categories", tuple(updates))
             self.execute_update(query, tuple(params))
             logger.info(f"Category updated: ID {category_id}")
 
@@ -507,36 +1198,47 @@ class DBManager:
         """
         results = self.execute_query(query, (category_id,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        # Parse tags and decrypt sensitive content (one pass + one batch)
+        self._prepare_items(results)
 
-        # Parse tags and decrypt sensitive content
-        for item in results:
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+        return results
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+    def _prepare_items(self, items: List[Dict]) -> None:
+        """
+        Parse tags and decrypt sensitive content of full item rows, in place
 
-        return results
+        One pass over the rows parses tags and collects the sensitive ones,
+        which are then decrypted with a single decrypt_many call.
+
+        Args:
+            items: Item dictionaries (SELECT * FROM items rows)
+        """
+        parse = _parse_tags
+        sensitive = []
+        for item in items:
+            item['tags'] = parse(item['tags'])
+            if item['is_sensitive'] and item['content']:
+                sensitive.append(item)
+        if sensitive:
+            self._decrypt_sensitive(sensitive)
+
+    def _decrypt_sensitive(self, items: List[Dict]) -> None:
+        """
+        Decrypt the content of sensitive items in place with one decrypt_many call
+
+        Args:
+            items: Item dictionaries as returned by execute_query
+        """
+        sensitive = [item for item in items if item.get('is_sensitive') and item.get('content')]
+        if not sensitive:
+            return
+        decrypted = self.enc.decrypt_many([item['content'] for item in sensitive])
+        for item, content in zip(sensitive, decrypted):
+            if content is None:
+                logger.error(f"Failed to decrypt item {item['id']}")
+                item['content'] = "[DECRYPTION ERROR]"
+            else:
+                item['content'] = content
 
     def get_item(self, item_id: int) -> Optional[Dict]:
         """
@@ -548,38 +1250,35 @@ class DBManager:
         Returns:
             Optional[Dict]: Item dictionary or None (content decrypted if sensitive)
         """
-        query = "SELECT * FROM items WHERE id = ?"
-        result = self.execute_query(query, (item_id,))
+        result = self.execute_query(GET_ITEM_SQL, (item_id,))
         if result:
             item = result[0]
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                from core.encryption_manager import EncryptionManager
-                encryption_manager = EncryptionManager()
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item_id}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item_id}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+            # Parse tags and decrypt sensitive content (same path as the list getters)
+            self._prepare_items([item])
 
             return item
         return None
 
+    def get_item_category_name(self, item_id: int) -> Optional[str]:
+        """
+        Get the name of the category an item belongs to
+
+        Reads only the key columns, so sensitive content is not decrypted.
+
+        Args:
+            item_id: Item ID
+
+        Returns:
+            Optional[str]: Category name or None if the item doesn't exist
+        """
+        query = """
+            SELECT c.name FROM items i
+            JOIN categories c ON c.id = i.category_id
+            WHERE i.id = ?
+        """
+        return self.execute_scalar(query, (item_id,))
+
     def add_item(self, category_id: int, label: str, content: str,
                  item_type: str = 'TEXT', icon: str = None,
                  is_sensitive: bool = False, is_favorite: bool = False,
@@ -612,27 +1311,127 @@ class DBManager:
         Returns:
             int: New item ID
         """
-        # Encrypt content if sensitive
-        if is_sensitive and content:
-            from core.encryption_manager import EncryptionManager
-            encryption_manager = EncryptionManager()
-            content = encryption_manager.encrypt(content)
-            logger.info(f"Content encrypted for sensitive item: {label}")
-
-        tags_json = json.dumps(tags or [])
-        query = """
-            INSERT INTO items
-            (category_id, label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """
-        item_id = self.execute_update(
-            query,
-            (category_id, label, content, item_type, icon, is_sensitive, is_favorite, tags_json, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista)
-        )
+        item_id = self.add_items([{
+            'category_id': category_id, 'label': label, 'content': content,
+            'item_type': item_type, 'icon': icon, 'is_sensitive': is_sensitive,
+            'is_favorite': is_favorite, 'tags': tags, 'description': description,
+            'working_dir': working_dir, 'color': color, 'is_active': is_active,
+            'is_archived': is_archived, 'is_list': is_list, 'list_group': list_group,
+            'orden_lista': orden_lista,
+        }])[0]
         list_info = f", List: {list_group}[{orden_lista}]" if is_list else ""
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info})")
         return item_id
 
+    def add_items(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several items with one executemany in a single transaction
+
+        Args:
+            rows: List of dicts using add_item's argument names; only
+                  category_id, label and content are required
+
+        Returns:
+            List[int]: New item IDs, in the same order as rows
+        """
+        if not rows:
+            return []
+
+        params_list = self._item_rows_to_params(rows)
+
+        with self.transaction("items") as conn:
+            item_ids = self._insert_item_params(conn, params_list, returning=True)
+
+        logger.debug(f"Items added: {len(item_ids)} (IDs {item_ids[0]}-{item_ids[-1]})")
+        return item_ids
+
+    def bulk_load(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many items with the secondary items indexes dropped
+
+        Preferred path for imports/restores: each index is rebuilt once
+        after the insert instead of being updated row by row. Everything
+        runs in one transaction, so a failure leaves the indexes intact.
+
+        Args:
+            rows: List of dicts in add_items format
+
+        Returns:
+            int: Number of items inserted
+        """
+        if not rows:
+            return 0
+
+        params_list = self._item_rows_to_params(rows)
+
+        with self.transaction("items") as conn:
+            # sqlite3 only opens the transaction implicitly before DML, so
+            # start it here to keep the DROP INDEX statements inside it
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            for index_name in ITEMS_SECONDARY_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+            self._insert_item_params(conn, params_list)
+            for create_sql in ITEMS_SECONDARY_INDEXES.values():
+                conn.execute(create_sql)
+
+        logger.info(f"Bulk loaded {len(params_list)} items")
+        return len(params_list)
+
+    @staticmethod
+    def _insert_item_params(conn: sqlite3.Connection, params_list: List[tuple],
+                            returning: bool = False) -> List[int]:
+        """
+        Insert item rows in multi-row INSERT statements
+
+        Chunks of up to ITEMS_PER_INSERT rows go in one statement each (one
+        parse/step instead of one per row).
+
+        Args:
+            conn: Writer connection (inside a transaction)
+            params_list: INSERT_ITEM_VALUES parameter tuples
+            returning: Collect the new ids with RETURNING
+
+        Returns:
+            List[int]: New item ids in row order (empty unless returning)
+        """
+        ids = []
+        for start in range(0, len(params_list), ITEMS_PER_INSERT):
+            chunk = params_list[start:start + ITEMS_PER_INSERT]
+            cursor = conn.execute(
+                _build_multi_insert_sql(len(chunk), returning),
+                [value for row in chunk for value in row]
+            )
+            if returning:
+                ids.extend(row[0] for row in cursor)
+        # RETURNING order is unspecified; AUTOINCREMENT ids grow in row order
+        ids.sort()
+        return ids
+
+    def _item_rows_to_params(self, rows: List[Dict[str, Any]]) -> List[tuple]:
+        """Build INSERT_ITEM_VALUES parameter tuples, encrypting sensitive content"""
+        contents = [row['content'] for row in rows]
+        # Encrypt sensitive content in one batch
+        sensitive = [i for i, row in enumerate(rows) if row.get('is_sensitive') and row['content']]
+        if sensitive:
+            encrypted = self.enc.encrypt_many([contents[i] for i in sensitive])
+            for i, content in zip(sensitive, encrypted):
+                contents[i] = content
+            logger.debug(f"Content encrypted for {len(sensitive)} sensitive items")
+
+        params_list = []
+        for row, content in zip(rows, contents):
+            params_list.append((
+                row['category_id'], row['label'], content,
+                row.get('item_type', 'TEXT'), row.get('icon'),
+                row.get('is_sensitive', False), row.get('is_favorite', False),
+                _json_dumps(row.get('tags') or []), row.get('description'),
+                row.get('working_dir'), row.get('color'),
+                row.get('is_active', True), row.get('is_archived', False),
+                row.get('is_list', False), row.get('list_group'), row.get('orden_lista', 0)
+            ))
+        return params_list
+
     def update_item(self, item_id: int, **kwargs) -> None:
         """
         Update item fields
@@ -655,27 +1454,25 @@ class DBManager:
         is_currently_sensitive = current_item.get('is_sensitive', False)
         will_be_sensitive = kwargs.get('is_sensitive', is_currently_sensitive)
 
-        for field, value in kwargs.items():
+        # Sorted so the same set of fields always maps to the same SQL text
+        for field, value in sorted(kwargs.items()):
             if field in allowed_fields:
                 # Handle tags serialization
                 if field == 'tags':
-                    value = json.dumps(value)
+                    value = _json_dumps(value)
                 # Handle content encryption for sensitive items
                 elif field == 'content' and will_be_sensitive and value:
-                    from core.encryption_manager import EncryptionManager
-                    encryption_manager = EncryptionManager()
                     # Only encrypt if not already encrypted
-                    if not encryption_manager.is_encrypted(value):
-                        value = encryption_manager.encrypt(value)
+                    if not self.enc.is_encrypted(value):
+                        value = self.enc.encrypt(value)
                         logger.info(f"Content encrypted for item ID: {item_id}")
 
-                updates.append(f"{field} = ?")
+                updates.append(field)
                 params.append(value)
 
         if updates:
-            updates.append("updated_at = CURRENT_TIMESTAMP")
             params.append(item_id)
-            query = f"UPDATE items SET {', '.join(updates)} WHERE id = ?"
+            query = _build_update_sql("items", tuple(updates))
             self.execute_update(query, tuple(params))
             logger.info(f"Item updated: ID {item_id}")
 
@@ -690,16 +1487,57 @@ class DBManager:
         self.execute_update(query, (item_id,))
         logger.info(f"Item deleted: ID {item_id}")
 
+    def delete_items_by_category(self, category_id: int) -> None:
+        """
+        Delete every item of a category with one statement
+
+        Args:
+            category_id: Category ID
+        """
+        query = "DELETE FROM items WHERE category_id = ?"
+        self.execute_update(query, (category_id,))
+        logger.info(f"Items deleted for category {category_id}")
+
     def update_last_used(self, item_id: int) -> None:
         """
         Update item's last_used timestamp
 
+        The timestamp is taken now but written later: uses are buffered and
+        flushed together LAST_USED_FLUSH_SECONDS after the first pending one
+        (or by flush_last_used/close), so repeated clicks cost one commit.
+
         Args:
             item_id: Item ID
         """
-        query = "UPDATE items SET last_used = CURRENT_TIMESTAMP WHERE id = ?"
-        self.execute_update(query, (item_id,))
-        logger.debug(f"Last used updated: ID {item_id}")
+        # Same format as CURRENT_TIMESTAMP (UTC, 'YYYY-MM-DD HH:MM:SS')
+        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        with self._last_used_lock:
+            self._last_used_pending[item_id] = timestamp
+            if self._last_used_timer is None:
+                self._last_used_timer = threading.Timer(LAST_USED_FLUSH_SECONDS, self.flush_last_used)
+                self._last_used_timer.daemon = True
+                self._last_used_timer.start()
+        logger.debug(f"Last used queued: ID {item_id}")
+
+    def flush_last_used(self) -> None:
+        """Write buffered last_used timestamps in a single transaction"""
+        with self._last_used_lock:
+            pending, self._last_used_pending = self._last_used_pending, {}
+            timer, self._last_used_timer = self._last_used_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not pending:
+            return
+
+        try:
+            with self.transaction("items") as conn:
+                conn.executemany(
+                    UPDATE_LAST_USED_SQL,
+                    [(timestamp, item_id) for item_id, timestamp in pending.items()]
+                )
+            logger.debug(f"Last used flushed for {len(pending)} items")
+        except sqlite3.Error as e:
+            logger.error(f"Error flushing last_used: {e}")
 
     def get_all_items(self, include_inactive: bool = False) -> List[Dict]:
         """
@@ -725,79 +1563,138 @@ class DBManager:
         """
         results = self.execute_query(query, (include_inactive,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
+        # Parse tags and decrypt sensitive content (one pass + one batch)
+        self._prepare_items(results)
 
-        # Parse tags and decrypt sensitive content
-        for item in results:
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+        return results
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+    def get_all_items_json(self, include_inactive: bool = False) -> str:
+        """
+        Get ALL items (same rows/order as get_all_items) as a JSON array string
 
-        return results
+        The JSON is built by SQLite itself (json_group_array/json_object), so no
+        per-row Python dicts are created. Meant for consumers that only forward
+        or serialize the data.
+
+        Sensitive items are encrypted at rest and SQLite cannot decrypt them:
+        their ``content`` is null here (use get_item() to read it). ``tags`` is
+        the stored JSON array; legacy CSV tags are passed through as a string.
+
+        Args:
+            include_inactive: Include items from inactive categories
+
+        Returns:
+            str: JSON array of item objects
+        """
+        query = """
+            SELECT json_group_array(json(item)) AS items_json
+            FROM (
+                SELECT json_object(
+                    'id', i.id,
+                    'category_id', i.category_id,
+                    'label', i.label,
+                    'content', CASE WHEN i.is_sensitive THEN NULL ELSE i.content END,
+                    'type', i.type,
+                    'icon', i.icon,
+                    'is_sensitive', i.is_sensitive,
+                    'is_favorite', i.is_favorite,
+                    'favorite_order', i.favorite_order,
+                    'use_count', i.use_count,
+                    'tags', CASE
+                        WHEN i.tags IS NULL OR i.tags = '' THEN json_array()
+                        WHEN json_valid(i.tags) THEN json(i.tags)
+                        ELSE i.tags
+                    END,
+                    'description', i.description,
+                    'working_dir', i.working_dir,
+                    'color', i.color,
+                    'badge', i.badge,
+                    'is_active', i.is_active,
+                    'is_archived', i.is_archived,
+                    'created_at', i.created_at,
+                    'updated_at', i.updated_at,
+                    'last_used', i.last_used,
+                    'is_list', i.is_list,
+                    'list_group', i.list_group,
+                    'orden_lista', i.orden_lista,
+                    'category_name', c.name,
+                    'category_icon', c.icon,
+                    'category_color', c.color
+                ) AS item
+                FROM items i
+                JOIN categories c ON i.category_id = c.id
+                WHERE c.is_active = 1 OR ? = 1
+                ORDER BY i.created_at DESC
+            )
+        """
+        return self.execute_scalar(query, (include_inactive,), "[]")
 
     def search_items(self, search_query: str, limit: int = 50) -> List[Dict]:
         """
-        Search items by label or content
+        Search items by label, content or tags
+
+        Uses the items_fts index (substring match); queries shorter than
+        FTS_MIN_QUERY_LENGTH fall back to LIKE. Sensitive content is never
+        matched. Only summary columns are returned: use get_item() for the
+        (decrypted) content of the item the user opens.
 
         Args:
             search_query: Search text
             limit: Maximum results
 
         Returns:
-            List[Dict]: List of matching items with category name
-        """
-        query = """
-            SELECT i.*, c.name as category_name
-            FROM items i
-            JOIN categories c ON i.category_id = c.id
-            WHERE i.label LIKE ? OR i.content LIKE ? OR i.tags LIKE ?
-            ORDER BY i.last_used DESC
-            LIMIT ?
-        """
-        search_pattern = f"%{search_query}%"
-        results = self.execute_query(
-            query,
-            (search_pattern, search_pattern, search_pattern, limit)
-        )
+            List[Dict]: Matching items (id, category_id, label, type, icon, tags,
+                        is_sensitive, is_favorite, last_used, category_name)
+        """
+        columns = """
+            i.id, i.category_id, i.label, i.type, i.icon, i.tags,
+            i.is_sensitive, i.is_favorite, i.last_used, c.name as category_name
+        """
+        if self._fts_enabled and len(search_query.strip()) >= FTS_MIN_QUERY_LENGTH:
+            query = f"""
+                SELECT {columns}
+                FROM items_fts f
+                JOIN items i ON i.id = f.rowid
+                JOIN categories c ON i.category_id = c.id
+                WHERE items_fts MATCH ?
+                ORDER BY i.last_used DESC
+                LIMIT ?
+            """
+            # Quoted as a single phrase: FTS operators in user input are literal
+            match = '"' + search_query.strip().replace('"', '""') + '"'
+            results = self.execute_query(query, (match, limit))
+        else:
+            query = f"""
+                SELECT {columns}
+                FROM items i
+                JOIN categories c ON i.category_id = c.id
+                WHERE i.label LIKE ? OR (i.is_sensitive = 0 AND i.content LIKE ?) OR i.tags LIKE ?
+                ORDER BY i.last_used DESC
+                LIMIT ?
+            """
+            search_pattern = f"%{search_query}%"
+            results = self.execute_query(
+                query,
+                (search_pattern, search_pattern, search_pattern, limit)
+            )
 
         # Parse tags
-        for item in results:
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+        _parse_item_tags(results)
 
         return results
 
+    def get_items_by_category_async(self, category_id: int) -> Future:
+        """get_items_by_category() on the background IO thread (see submit)"""
+        return self.submit(self.get_items_by_category, category_id)
+
+    def get_all_items_async(self, include_inactive: bool = False) -> Future:
+        """get_all_items() on the background IO thread (see submit)"""
+        return self.submit(self.get_all_items, include_inactive)
+
+    def search_items_async(self, search_query: str, limit: int = 50) -> Future:
+        """search_items() on the background IO thread (see submit)"""
+        return self.submit(self.search_items, search_query, limit)
+
     # ========== LISTAS AVANZADAS ==========
 
     def create_list(self, category_id: int, list_name: str, items_data: List[Dict[str, Any]]) -> List[int]:
@@ -823,38 +1720,52 @@ class DBManager:
         if not self.is_list_name_unique(category_id, list_name):
             raise ValueError(f"El nombre de lista '{list_name}' ya existe en esta categoría")
 
-        item_ids = []
-
         try:
-            with self.transaction() as conn:
-                for orden, item_data in enumerate(items_data, start=1):
-                    # Agregar item con campos de lista
-                    item_id = self.add_item(
-                        category_id=category_id,
-                        label=item_data.get('label', f'Paso {orden}'),
-                        content=item_data.get('content', ''),
-                        item_type=item_data.get('type', 'TEXT'),
-                        icon=item_data.get('icon'),
-                        is_sensitive=item_data.get('is_sensitive', False),
-                        tags=item_data.get('tags'),
-                        description=item_data.get('description'),
-                        working_dir=item_data.get('working_dir'),
-                        color=item_data.get('color'),
-                        # Campos de lista
-                        is_list=True,
-                        list_group=list_name,
-                        orden_lista=orden
-                    )
-                    item_ids.append(item_id)
-
-                logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
+            # Un solo executemany en una transacción (add_items)
+            item_ids = self.add_items([
+                self._list_item_row(category_id, list_name, orden, item_data)
+                for orden, item_data in enumerate(items_data, start=1)
+            ])
 
+            logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
             return item_ids
 
         except Exception as e:
             logger.error(f"Error al crear lista '{list_name}': {e}")
             raise
 
+    @staticmethod
+    def _list_item_row(category_id: int, list_name: str, orden: int,
+                       item_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convierte los datos de un paso de lista en una fila de add_items
+
+        Args:
+            category_id: ID de la categoría
+            list_name: Nombre de la lista (list_group)
+            orden: Posición del paso (orden_lista, desde 1)
+            item_data: Datos del paso (label, content, type, ...)
+
+        Returns:
+            Dict: Fila en formato add_items
+        """
+        return {
+            'category_id': category_id,
+            'label': item_data.get('label', f'Paso {orden}'),
+            'content': item_data.get('content', ''),
+            'item_type': item_data.get('type', 'TEXT'),
+            'icon': item_data.get('icon'),
+            'is_sensitive': item_data.get('is_sensitive', False),
+            'tags': item_data.get('tags'),
+            'description': item_data.get('description'),
+            'working_dir': item_data.get('working_dir'),
+            'color': item_data.get('color'),
+            # Campos de lista
+            'is_list': True,
+            'list_group': list_name,
+            'orden_lista': orden,
+        }
+
     def get_lists_by_category(self, category_id: int) -> List[Dict[str, Any]]:
         """
         Obtiene resumen de todas las listas en una categoría
@@ -913,31 +1824,9 @@ class DBManager:
         """
         results = self.execute_query(query, (category_id, list_group))
 
-        # Desencriptar y parsear tags (mismo proceso que en get_items_by_category)
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
-
-        for item in results:
-            # Parse tags
-            if item['tags']:
-                try:
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
-
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+        # Parsear tags y desencriptar en un solo recorrido + un lote
+        # (mismo proceso que en get_items_by_category)
+        self._prepare_items(results)
 
         logger.debug(f"Obtenidos {len(results)} items de lista '{list_group}'")
         return results
@@ -969,39 +1858,17 @@ class DBManager:
             return True
 
         try:
-            with self.transaction() as conn:
-                cursor = conn.cursor()
-
-                # Si movemos hacia arriba (new_orden < old_orden)
-                # Incrementar orden de los items entre new_orden y old_orden
-                if new_orden < old_orden:
-                    cursor.execute("""
-                        UPDATE items
-                        SET orden_lista = orden_lista + 1
-                        WHERE category_id = ?
-                        AND list_group = ?
-                        AND orden_lista >= ?
-                        AND orden_lista < ?
-                    """, (category_id, list_group, new_orden, old_orden))
-
-                # Si movemos hacia abajo (new_orden > old_orden)
-                # Decrementar orden de los items entre old_orden y new_orden
-                else:
-                    cursor.execute("""
-                        UPDATE items
-                        SET orden_lista = orden_lista - 1
-                        WHERE category_id = ?
-                        AND list_group = ?
-                        AND orden_lista > ?
-                        AND orden_lista <= ?
-                    """, (category_id, list_group, old_orden, new_orden))
-
-                # Actualizar el item movido
-                cursor.execute("""
-                    UPDATE items
-                    SET orden_lista = ?
-                    WHERE id = ?
-                """, (new_orden, item_id))
+            with self.transaction("items") as conn:
+                # Una sola sentencia para ambos sentidos: el item movido toma
+                # new_orden; los del rango entre ambas posiciones se desplazan
+                # +1 (hacia arriba, new_orden < old_orden) o -1 (hacia abajo)
+                conn.execute(REORDER_LIST_ITEM_SQL, {
+                    'id': item_id,
+                    'new': new_orden,
+                    'old': old_orden,
+                    'cat': category_id,
+                    'lg': list_group,
+                })
 
                 logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
                 return True
@@ -1028,7 +1895,7 @@ class DBManager:
                 AND list_group = ?
                 AND is_list = 1
             """
-            with self.transaction() as conn:
+            with self.transaction("items") as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, (category_id, list_group))
                 deleted_count = cursor.rowcount
@@ -1059,7 +1926,7 @@ class DBManager:
             bool: True si se actualizó exitosamente
         """
         try:
-            with self.transaction() as conn:
+            with self.transaction("items") as conn:
                 # Caso 1: Solo renombrar
                 if new_list_group and new_list_group != old_list_group:
                     # Validar que el nuevo nombre sea único
@@ -1079,12 +1946,8 @@ class DBManager:
 
                 # Caso 2: Actualizar items de la lista
                 if items_data is not None:
-                    # Eliminar items actuales
                     final_list_name = new_list_group if new_list_group else old_list_group
-                    self.delete_list(category_id, final_list_name)
-
-                    # Crear nuevos items
-                    self.create_list(category_id, final_list_name, items_data)
+                    self._sync_list_items(conn, category_id, final_list_name, items_data)
 
                     logger.info(f"Lista '{final_list_name}' actualizada con {len(items_data)} items")
 
@@ -1094,6 +1957,67 @@ class DBManager:
             logger.error(f"Error al actualizar lista '{old_list_group}': {e}")
             return False
 
+    def _sync_list_items(self, conn: sqlite3.Connection, category_id: int,
+                         list_group: str, items_data: List[Dict[str, Any]]) -> None:
+        """
+        Ajusta los items de una lista a items_data por posición (orden_lista)
+
+        Las posiciones comunes se actualizan en sitio (conservan su ID, así
+        que clipboard_history y los favoritos siguen apuntando al mismo
+        item), los pasos nuevos se insertan y los sobrantes se eliminan.
+
+        Args:
+            conn: Conexión dentro de la transacción de update_list
+            category_id: ID de la categoría
+            list_group: Nombre (final) de la lista
+            items_data: Datos de los pasos, en orden
+        """
+        if not items_data:
+            raise ValueError("La lista debe tener al menos 1 item")
+
+        existing_ids = [row[0] for row in conn.execute("""
+            SELECT id FROM items
+            WHERE category_id = ?
+            AND list_group = ?
+            AND is_list = 1
+            ORDER BY orden_lista
+        """, (category_id, list_group))]
+
+        params_list = self._item_rows_to_params([
+            self._list_item_row(category_id, list_group, orden, item_data)
+            for orden, item_data in enumerate(items_data, start=1)
+        ])
+        common = min(len(existing_ids), len(params_list))
+
+        # Posiciones comunes: UPDATE en sitio
+        updates = []
+        for item_id, params in zip(existing_ids, params_list):
+            (_, label, content, item_type, icon, is_sensitive, _, tags, description,
+             working_dir, color, is_active, is_archived, _, _, orden) = params
+            updates.append((label, content, item_type, icon, is_sensitive, tags, description,
+                            working_dir, color, is_active, is_archived, orden, item_id))
+        if updates:
+            conn.executemany("""
+                UPDATE items
+                SET label = ?, content = ?, type = ?, icon = ?, is_sensitive = ?, tags = ?,
+                    description = ?, working_dir = ?, color = ?, is_active = ?, is_archived = ?,
+                    orden_lista = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, updates)
+
+        # Pasos nuevos al final
+        if len(params_list) > common:
+            self._insert_item_params(conn, params_list[common:])
+
+        # Pasos sobrantes
+        removed_ids = existing_ids[common:]
+        if removed_ids:
+            placeholders = ", ".join("?" * len(removed_ids))
+            conn.execute(f"DELETE FROM items WHERE id IN ({placeholders})", removed_ids)
+
+        logger.debug(f"Lista '{list_group}': {len(updates)} actualizados, "
+                     f"{len(params_list) - common} nuevos, {len(removed_ids)} eliminados")
+
     def is_list_name_unique(self, category_id: int, list_name: str, exclude_list: str = None) -> bool:
         """
         Verifica si el nombre de lista es único en la categoría
@@ -1106,28 +2030,11 @@ class DBManager:
         Returns:
             bool: True si el nombre es único, False si ya existe
         """
-        if exclude_list:
-            query = """
-                SELECT COUNT(*) as count
-                FROM items
-                WHERE category_id = ?
-                AND list_group = ?
-                AND is_list = 1
-                AND list_group != ?
-            """
-            result = self.execute_query(query, (category_id, list_name, exclude_list))
-        else:
-            query = """
-                SELECT COUNT(*) as count
-                FROM items
-                WHERE category_id = ?
-                AND list_group = ?
-                AND is_list = 1
-            """
-            result = self.execute_query(query, (category_id, list_name))
-
-        count = result[0]['count'] if result else 0
-        is_unique = count == 0
+        # Una sola sentencia para ambos casos (exclude_list None => IS NOT NULL,
+        # siempre cierto) y EXISTS se detiene en la primera coincidencia
+        is_unique = not self.execute_scalar(
+            LIST_NAME_TAKEN_SQL, (category_id, list_name, exclude_list)
+        )
 
         logger.debug(f"Nombre de lista '{list_name}' en categoría {category_id}: {'único' if is_unique else 'ya existe'}")
         return is_unique
@@ -1150,6 +2057,8 @@ class DBManager:
             VALUES (?, ?)
         """
         history_id = self.execute_update(query, (item_id, content))
+        if self._history_count is not None:
+            self._history_count += 1
         logger.debug(f"History entry added: ID {history_id}")
 
         # Auto-trim history to max_history setting
@@ -1181,25 +2090,39 @@ class DBManager:
         """Clear all clipboard history"""
         query = "DELETE FROM clipboard_history"
         self.execute_update(query)
+        self._history_count = 0
         logger.info("Clipboard history cleared")
 
     def trim_history(self, keep_latest: int = 20) -> None:
         """
         Keep only the latest N history entries
 
+        The row count is cached, so a history under the limit costs no query.
+        The delete itself does not trust that count (other DBManager instances
+        may have removed rows): it drops only the rows older than the
+        keep_latest-th newest one, found with a bounded walk of the copied_at
+        index, and the count is refreshed afterwards.
+
         Args:
             keep_latest: Number of entries to keep
         """
+        if self._history_count is None:
+            self._history_count = self.execute_scalar("SELECT COUNT(*) FROM clipboard_history")
+
+        if self._history_count <= keep_latest:
+            return
+
         query = """
             DELETE FROM clipboard_history
-            WHERE id NOT IN (
-                SELECT id FROM clipboard_history
+            WHERE copied_at < (
+                SELECT copied_at FROM clipboard_history
                 ORDER BY copied_at DESC
-                LIMIT ?
+                LIMIT 1 OFFSET ?
             )
         """
-        self.execute_update(query, (keep_latest,))
-        logger.debug(f"History trimmed to {keep_latest} entries")
+        self.execute_update(query, (keep_latest - 1,))
+        self._history_count = self.execute_scalar("SELECT COUNT(*) FROM clipboard_history")
+        logger.debug(f"History trimmed to {self._history_count} entries")
 
     # ========== PINNED PANELS ==========
 
@@ -1248,23 +2171,14 @@ class DBManager:
         Returns:
             List[Dict]: List of panel dictionaries with category info
         """
-        if active_only:
-            query = """
-                SELECT p.*, c.name as category_name, c.icon as category_icon
-                FROM pinned_panels p
-                JOIN categories c ON p.category_id = c.id
-                WHERE p.is_active = 1
-                ORDER BY p.last_opened DESC
-            """
-            panels = self.execute_query(query)
-        else:
-            query = """
-                SELECT p.*, c.name as category_name, c.icon as category_icon
-                FROM pinned_panels p
-                JOIN categories c ON p.category_id = c.id
-                ORDER BY p.last_opened DESC
-            """
-            panels = self.execute_query(query)
+        query = """
+            SELECT p.*, c.name as category_name, c.icon as category_icon
+            FROM pinned_panels p
+            JOIN categories c ON p.category_id = c.id
+            WHERE p.is_active = 1 OR ? = 0
+            ORDER BY p.last_opened DESC
+        """
+        panels = self.execute_query(query, (int(active_only),))
         logger.debug(f"Retrieved {len(panels)} pinned panels (active_only={active_only})")
         return panels
 
@@ -1307,7 +2221,8 @@ class DBManager:
         updates = []
         params = []
 
-        for field, value in kwargs.items():
+        # Orden estable de columnas: misma forma -> mismo SQL (cache de sentencias)
+        for field, value in sorted(kwargs.items()):
             if field in allowed_fields:
                 updates.append(f"{field} = ?")
                 params.append(value)
@@ -1324,17 +2239,42 @@ class DBManager:
         """
         Update last_opened timestamp and increment open_count
 
+        Buffered like update_last_used: opens are counted in memory and
+        written by flush_panel_stats, so N opens of a panel cost one UPDATE.
+
         Args:
             panel_id: Panel ID
         """
-        query = """
-            UPDATE pinned_panels
-            SET last_opened = CURRENT_TIMESTAMP,
-                open_count = open_count + 1
-            WHERE id = ?
-        """
-        self.execute_update(query, (panel_id,))
-        logger.debug(f"Panel {panel_id} opened - statistics updated")
+        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        with self._panel_stats_lock:
+            stats = self._panel_stats_pending.setdefault(panel_id, [0, timestamp])
+            stats[0] += 1
+            stats[1] = timestamp
+            if self._panel_stats_timer is None:
+                self._panel_stats_timer = threading.Timer(LAST_USED_FLUSH_SECONDS, self.flush_panel_stats)
+                self._panel_stats_timer.daemon = True
+                self._panel_stats_timer.start()
+        logger.debug(f"Panel {panel_id} opened - statistics queued")
+
+    def flush_panel_stats(self) -> None:
+        """Write buffered panel open counts and timestamps in a single transaction"""
+        with self._panel_stats_lock:
+            pending, self._panel_stats_pending = self._panel_stats_pending, {}
+            timer, self._panel_stats_timer = self._panel_stats_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not pending:
+            return
+
+        try:
+            with self.transaction("pinned_panels") as conn:
+                conn.executemany(
+                    UPDATE_PANEL_STATS_SQL,
+                    [(opens, timestamp, panel_id) for panel_id, (opens, timestamp) in pending.items()]
+                )
+            logger.debug(f"Panel statistics flushed for {len(pending)} panels")
+        except sqlite3.Error as e:
+            logger.error(f"Error flushing panel statistics: {e}")
 
     def delete_pinned_panel(self, panel_id: int) -> bool:
         """
@@ -1400,6 +2340,27 @@ class DBManager:
         result = self.execute_query(query, (category_id,))
         return result[0] if result else None
 
+    def has_active_panel_for_category(self, category_id: int) -> bool:
+        """
+        Check whether an active panel exists for this category
+
+        Cheaper than get_panel_by_category when the panel data is not needed:
+        no JOIN with categories, answered from idx_pinned_category.
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            bool: True if an active panel exists
+        """
+        query = """
+            SELECT EXISTS (
+                SELECT 1 FROM pinned_panels
+                WHERE category_id = ? AND is_active = 1
+            ) AS found
+        """
+        return bool(self.execute_scalar(query, (category_id,)))
+
     # ========== BROWSER CONFIG ==========
 
     def get_browser_config(self) -> Dict:
@@ -1449,49 +2410,28 @@ class DBManager:
             bool: True if save successful
         """
         try:
-            # Check if config exists
-            query = "SELECT id FROM browser_config LIMIT 1"
-            result = self.execute_query(query)
-
-            if result:
-                # Update existing config
-                config_id = result[0]['id']
-                update_query = """
-                    UPDATE browser_config
-                    SET home_url = ?,
-                        is_visible = ?,
-                        width = ?,
-                        height = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """
-                self.execute_update(
-                    update_query,
-                    (
-                        config.get('home_url', 'https://www.google.com'),
-                        config.get('is_visible', False),
-                        config.get('width', 500),
-                        config.get('height', 700),
-                        config_id
-                    )
-                )
-                logger.info(f"Browser config updated: ID {config_id}")
-            else:
-                # Insert new config
-                insert_query = """
-                    INSERT INTO browser_config (home_url, is_visible, width, height)
-                    VALUES (?, ?, ?, ?)
-                """
-                self.execute_update(
-                    insert_query,
-                    (
-                        config.get('home_url', 'https://www.google.com'),
-                        config.get('is_visible', False),
-                        config.get('width', 500),
-                        config.get('height', 700)
-                    )
+            # Una sola sentencia: la fila única (la existente, o id 1) se
+            # inserta o se actualiza (UPSERT)
+            upsert_query = """
+                INSERT INTO browser_config (id, home_url, is_visible, width, height)
+                VALUES (COALESCE((SELECT MIN(id) FROM browser_config), 1), ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    home_url = excluded.home_url,
+                    is_visible = excluded.is_visible,
+                    width = excluded.width,
+                    height = excluded.height,
+                    updated_at = CURRENT_TIMESTAMP
+            """
+            self.execute_update(
+                upsert_query,
+                (
+                    config.get('home_url', 'https://www.google.com'),
+                    config.get('is_visible', False),
+                    config.get('width', 500),
+                    config.get('height', 700)
                 )
-                logger.info("Browser config created")
+            )
+            logger.info("Browser config saved")
 
             return True
 
@@ -1514,7 +2454,7 @@ class DBManager:
             ORDER BY is_default DESC, last_used DESC
         """
         try:
-            result = self.execute_query(query)
+            result = self._cached_query(query, (), ("browser_profiles",))
             logger.debug(f"Retrieved {len(result) if result else 0} browser profiles")
             return result if result else []
         except Exception as e:
@@ -1535,7 +2475,7 @@ class DBManager:
             LIMIT 1
         """
         try:
-            result = self.execute_query(query)
+            result = self._cached_query(query, (), ("browser_profiles",))
             if result:
                 logger.debug(f"Default profile: {result[0]['name']}")
                 return result[0]
@@ -1562,7 +2502,7 @@ class DBManager:
             WHERE id = ?
         """
         try:
-            result = self.execute_query(query, (profile_id,))
+            result = self._cached_query(query, (profile_id,), ("browser_profiles",))
             return result[0] if result else None
         except Exception as e:
             logger.error(f"Error getting profile {profile_id}: {e}")
@@ -1587,25 +2527,19 @@ class DBManager:
                 safe_name = re.sub(r'[^\w\-]', '_', name.lower())
                 storage_path = f"browser_data/{safe_name}"
 
-            # Check if name already exists
-            check_query = "SELECT id FROM browser_profiles WHERE name = ?"
-            existing = self.execute_query(check_query, (name,))
-
-            if existing:
-                logger.warning(f"Profile with name '{name}' already exists")
-                return None
-
-            # Insert new profile
+            # Insert new profile; an existing name (UNIQUE) inserts nothing
             insert_query = """
                 INSERT INTO browser_profiles (name, storage_path, is_default)
                 VALUES (?, ?, 0)
+                ON CONFLICT(name) DO NOTHING
+                RETURNING id
             """
-            self.execute_update(insert_query, (name, storage_path))
+            rows = self.execute_returning(insert_query, (name, storage_path))
 
-            # Get inserted ID
-            last_id_query = "SELECT last_insert_rowid() as id"
-            result = self.execute_query(last_id_query)
-            profile_id = result[0]['id'] if result else None
+            if not rows:
+                logger.warning(f"Profile with name '{name}' already exists")
+                return None
+            profile_id = rows[0]['id']
 
             logger.info(f"Browser profile created: '{name}' (ID: {profile_id})")
             return profile_id
@@ -1625,20 +2559,21 @@ class DBManager:
             bool: True if deleted successfully
         """
         try:
-            # Check if it's the default profile
-            profile = self.get_profile_by_id(profile_id)
-            if not profile:
-                logger.warning(f"Profile {profile_id} not found")
-                return False
-
-            if profile['is_default']:
-                logger.warning("Cannot delete default profile")
+            # The default profile is protected by the WHERE clause itself
+            with self.transaction("browser_profiles") as conn:
+                deleted = conn.execute(
+                    "DELETE FROM browser_profiles WHERE id = ? AND is_default = 0",
+                    (profile_id,)
+                ).rowcount
+
+            if not deleted:
+                # Miss path only: find out why for the log
+                if self.get_profile_by_id(profile_id):
+                    logger.warning("Cannot delete default profile")
+                else:
+                    logger.warning(f"Profile {profile_id} not found")
                 return False
 
-            # Delete profile
-            delete_query = "DELETE FROM browser_profiles WHERE id = ?"
-            self.execute_update(delete_query, (profile_id,))
-
             logger.info(f"Browser profile {profile_id} deleted")
             return True
 
@@ -1657,13 +2592,14 @@ class DBManager:
             bool: True if successful
         """
         try:
-            # Remove default from all profiles
-            update_all_query = "UPDATE browser_profiles SET is_default = 0"
-            self.execute_update(update_all_query)
-
-            # Set new default
-            update_query = "UPDATE browser_profiles SET is_default = 1 WHERE id = ?"
-            self.execute_update(update_query, (profile_id,))
+            # One statement: clears the old default and sets the new one
+            # atomically, touching only those two rows (idx_browser_profiles_default)
+            update_query = """
+                UPDATE browser_profiles
+                SET is_default = (id = ?)
+                WHERE is_default = 1 OR id = ?
+            """
+            self.execute_update(update_query, (profile_id, profile_id))
 
             logger.info(f"Profile {profile_id} set as default")
             return True
@@ -1696,6 +2632,34 @@ class DBManager:
             logger.error(f"Error updating profile last_used: {e}")
             return False
 
+    def update_profiles_last_used(self, profile_ids) -> bool:
+        """
+        Update last_used for several profiles with a single UPDATE.
+
+        Args:
+            profile_ids: Iterable of profile IDs
+
+        Returns:
+            bool: True if successful
+        """
+        profile_ids = list(profile_ids)
+        if not profile_ids:
+            return True
+        try:
+            placeholders = ", ".join("?" * len(profile_ids))
+            update_query = f"""
+                UPDATE browser_profiles
+                SET last_used = CURRENT_TIMESTAMP
+                WHERE id IN ({placeholders})
+            """
+            self.execute_update(update_query, tuple(profile_ids))
+            logger.debug(f"Profiles {profile_ids} last_used updated")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating profiles last_used: {e}")
+            return False
+
     # ==================== Bookmarks Management ====================
 
     def add_bookmark(self, title: str, url: str, folder: str = None) -> Optional[int]:
@@ -1711,30 +2675,22 @@ class DBManager:
             int: ID del marcador creado, o None si falla
         """
         try:
-            # Verificar si el marcador ya existe
-            check_query = "SELECT id FROM bookmarks WHERE url = ?"
-            existing = self.execute_query(check_query, (url,))
-
-            if existing:
-                logger.warning(f"Marcador ya existe para URL: {url}")
-                return existing[0]['id']
-
-            # Obtener el siguiente order_index
-            max_order_query = "SELECT COALESCE(MAX(order_index), -1) + 1 as next_order FROM bookmarks"
-            result = self.execute_query(max_order_query)
-            next_order = result[0]['next_order'] if result else 0
-
-            # Insertar marcador
+            # Insertar marcador al final (order_index calculado en la misma
+            # sentencia); si la URL ya existe (idx_bookmarks_url) no se
+            # inserta nada y RETURNING no devuelve filas
             insert_query = """
                 INSERT INTO bookmarks (title, url, folder, order_index)
-                VALUES (?, ?, ?, ?)
+                SELECT ?, ?, ?, (SELECT COALESCE(MAX(order_index), -1) + 1 FROM bookmarks)
+                WHERE NOT EXISTS (SELECT 1 FROM bookmarks WHERE url = ?)
+                RETURNING id
             """
-            self.execute_update(insert_query, (title, url, folder, next_order))
-
-            # Obtener el ID insertado
-            last_id_query = "SELECT last_insert_rowid() as id"
-            result = self.execute_query(last_id_query)
-            bookmark_id = result[0]['id'] if result else None
+            rows = self.execute_returning(insert_query, (title, url, folder, url))
+            if not rows:
+                logger.warning(f"Marcador ya existe para URL: {url}")
+                return self.execute_scalar(
+                    "SELECT id FROM bookmarks WHERE url = ? ORDER BY id LIMIT 1", (url,)
+                )
+            bookmark_id = rows[0]['id']
 
             logger.info(f"Marcador agregado: '{title}' - {url}")
             return bookmark_id
@@ -1761,14 +2717,14 @@ class DBManager:
                     WHERE folder = ?
                     ORDER BY order_index ASC, created_at DESC
                 """
-                result = self.execute_query(query, (folder,))
+                result = self._cached_query(query, (folder,), ("bookmarks",))
             else:
                 query = """
                     SELECT id, title, url, folder, icon, created_at, order_index
                     FROM bookmarks
                     ORDER BY order_index ASC, created_at DESC
                 """
-                result = self.execute_query(query)
+                result = self._cached_query(query, (), ("bookmarks",))
 
             return result if result else []
 
@@ -1787,8 +2743,11 @@ class DBManager:
             bool: True si se eliminó correctamente
         """
         try:
-            delete_query = "DELETE FROM bookmarks WHERE id = ?"
-            self.execute_update(delete_query, (bookmark_id,))
+            with self.transaction("bookmarks") as conn:
+                deleted = conn.execute("DELETE FROM bookmarks WHERE id = ?", (bookmark_id,)).rowcount
+            if not deleted:
+                logger.warning(f"Marcador no encontrado: ID {bookmark_id}")
+                return False
             logger.info(f"Marcador eliminado: ID {bookmark_id}")
             return True
 
@@ -1811,28 +2770,19 @@ class DBManager:
             bool: True si se actualizó correctamente
         """
         try:
-            # Construir query dinámicamente solo con campos no-None
-            updates = []
-            params = []
-
-            if title is not None:
-                updates.append("title = ?")
-                params.append(title)
-
-            if url is not None:
-                updates.append("url = ?")
-                params.append(url)
-
-            if folder is not None:
-                updates.append("folder = ?")
-                params.append(folder)
+            # Solo campos no-None, en orden fijo: misma combinación -> mismo
+            # SQL (memoizado y reutilizado por la cache de sentencias)
+            fields = (('title', title), ('url', url), ('folder', folder))
+            updates = tuple(field for field, value in fields if value is not None)
+            params = [value for _, value in fields if value is not None]
 
             if not updates:
                 logger.warning("No se especificaron campos para actualizar")
                 return False
 
             params.append(bookmark_id)
-            update_query = f"UPDATE bookmarks SET {', '.join(updates)} WHERE id = ?"
+            # bookmarks no tiene columna updated_at
+            update_query = _build_update_sql("bookmarks", updates, touch_updated_at=False)
 
             self.execute_update(update_query, tuple(params))
             logger.info(f"Marcador actualizado: ID {bookmark_id}")
@@ -1853,9 +2803,8 @@ class DBManager:
             bool: True si el marcador existe
         """
         try:
-            query = "SELECT id FROM bookmarks WHERE url = ?"
-            result = self.execute_query(query, (url,))
-            return len(result) > 0 if result else False
+            query = "SELECT EXISTS (SELECT 1 FROM bookmarks WHERE url = ?)"
+            return bool(self.execute_scalar(query, (url,)))
 
         except Exception as e:
             logger.error(f"Error al verificar marcador: {e}")
@@ -1879,22 +2828,15 @@ class DBManager:
             int: ID del speed dial creado, o None si falla
         """
         try:
-            # Obtener la siguiente posición
-            max_pos_query = "SELECT COALESCE(MAX(position), -1) + 1 as next_pos FROM speed_dials"
-            result = self.execute_query(max_pos_query)
-            next_position = result[0]['next_pos'] if result else 0
-
-            # Insertar speed dial
+            # Insertar speed dial al final (posición calculada en la misma sentencia)
             insert_query = """
                 INSERT INTO speed_dials (title, url, icon, background_color, thumbnail_path, position)
-                VALUES (?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM speed_dials))
+                RETURNING id
             """
-            self.execute_update(insert_query, (title, url, icon, background_color, thumbnail_path, next_position))
-
-            # Obtener el ID insertado
-            last_id_query = "SELECT last_insert_rowid() as id"
-            result = self.execute_query(last_id_query)
-            speed_dial_id = result[0]['id'] if result else None
+            speed_dial_id = self.execute_returning(
+                insert_query, (title, url, icon, background_color, thumbnail_path)
+            )[0]['id']
 
             logger.info(f"Speed dial agregado: '{title}' - {url}")
             return speed_dial_id
@@ -1916,7 +2858,7 @@ class DBManager:
                 FROM speed_dials
                 ORDER BY position ASC
             """
-            result = self.execute_query(query)
+            result = self._cached_query(query, (), ("speed_dials",))
             return result if result else []
 
         except Exception as e:
@@ -1941,39 +2883,24 @@ class DBManager:
             bool: True si se actualizó correctamente
         """
         try:
-            # Construir query dinámicamente solo con campos no-None
-            updates = []
-            params = []
-
-            if title is not None:
-                updates.append("title = ?")
-                params.append(title)
-
-            if url is not None:
-                updates.append("url = ?")
-                params.append(url)
-
-            if icon is not None:
-                updates.append("icon = ?")
-                params.append(icon)
-
-            if background_color is not None:
-                updates.append("background_color = ?")
-                params.append(background_color)
-
-            if thumbnail_path is not None:
-                updates.append("thumbnail_path = ?")
-                params.append(thumbnail_path)
+            # Solo campos no-None, en orden fijo: misma combinación -> mismo
+            # SQL (memoizado y reutilizado por la cache de sentencias)
+            fields = (
+                ('title', title),
+                ('url', url),
+                ('icon', icon),
+                ('background_color', background_color),
+                ('thumbnail_path', thumbnail_path),
+            )
+            updates = tuple(field for field, value in fields if value is not None)
+            params = [value for _, value in fields if value is not None]
 
             if not updates:
                 logger.warning("No se especificaron campos para actualizar")
                 return False
 
-            updates.append("updated_at = CURRENT_TIMESTAMP")
             params.append(speed_dial_id)
-
-            update_query = f"UPDATE speed_dials SET {', '.join(updates)} WHERE id = ?"
-            self.execute_update(update_query, tuple(params))
+            self.execute_update(_build_update_sql("speed_dials", updates), tuple(params))
             logger.info(f"Speed dial actualizado: ID {speed_dial_id}")
             return True
 
@@ -1992,12 +2919,15 @@ class DBManager:
             bool: True si se eliminó correctamente
         """
         try:
-            delete_query = "DELETE FROM speed_dials WHERE id = ?"
-            self.execute_update(delete_query, (speed_dial_id,))
+            with self.transaction("speed_dials") as conn:
+                deleted = conn.execute("DELETE FROM speed_dials WHERE id = ?", (speed_dial_id,)).rowcount
+                # Reorganizar posiciones
+                if deleted:
+                    self._reorder_speed_dials()
+            if not deleted:
+                logger.warning(f"Speed dial no encontrado: ID {speed_dial_id}")
+                return False
             logger.info(f"Speed dial eliminado: ID {speed_dial_id}")
-
-            # Reorganizar posiciones
-            self._reorder_speed_dials()
             return True
 
         except Exception as e:
@@ -2016,9 +2946,25 @@ class DBManager:
             bool: True si se reordenó correctamente
         """
         try:
-            update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
-            self.execute_update(update_query, (new_position, speed_dial_id))
-            self._reorder_speed_dials()
+            with self.transaction("speed_dials") as conn:
+                row = conn.execute(
+                    "SELECT position, (SELECT MAX(position) FROM speed_dials) FROM speed_dials WHERE id = ?",
+                    (speed_dial_id,)
+                ).fetchone()
+                if row is None:
+                    logger.warning(f"Speed dial {speed_dial_id} no encontrado")
+                    return False
+
+                old_position, last_position = row
+                # Posiciones consecutivas (ver _reorder_speed_dials): basta con
+                # desplazar el rango entre ambas posiciones, sin renumerar todo
+                new_position = max(0, min(new_position, last_position))
+                if new_position != old_position:
+                    conn.execute(REORDER_SPEED_DIAL_SQL, {
+                        'id': speed_dial_id,
+                        'new': new_position,
+                        'old': old_position,
+                    })
             logger.info(f"Speed dial reordenado: ID {speed_dial_id} -> posición {new_position}")
             return True
 
@@ -2029,14 +2975,11 @@ class DBManager:
     def _reorder_speed_dials(self):
         """Reorganiza las posiciones de speed dials para que sean consecutivas (0, 1, 2, ...)."""
         try:
-            # Obtener todos los speed dials ordenados por posición actual
-            speed_dials = self.get_speed_dials()
-
-            # Actualizar posiciones para que sean consecutivas
-            for index, sd in enumerate(speed_dials):
-                if sd['position'] != index:
-                    update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
-                    self.execute_update(update_query, (index, sd['id']))
+            # Una sola sentencia: numera por posición actual (id desempata,
+            # igual que el orden de idx_speed_dials_position) y solo escribe
+            # las filas cuya posición cambia
+            with self.transaction("speed_dials") as conn:
+                conn.execute(REORDER_SPEED_DIALS_SQL)
 
         except Exception as e:
             logger.error(f"Error al reorganizar speed dials: {e}")
@@ -2056,40 +2999,31 @@ class DBManager:
             int: ID de la sesión creada o None si falla
         """
         try:
-            # Si es auto-save, eliminar sesiones auto-save anteriores
-            if is_auto_save:
-                delete_query = "DELETE FROM browser_sessions WHERE is_auto_save = 1"
-                self.execute_update(delete_query)
-
-            # Crear sesión
-            insert_query = """
-                INSERT INTO browser_sessions (name, is_auto_save)
-                VALUES (?, ?)
-            """
-            self.execute_update(insert_query, (name, 1 if is_auto_save else 0))
-
-            # Obtener ID de la sesión creada
-            session_id_query = "SELECT last_insert_rowid() as id"
-            result = self.execute_query(session_id_query)
-            if not result:
-                logger.error("No se pudo obtener el ID de la sesión")
-                return None
-
-            session_id = result[0]['id']
-
-            # Guardar pestañas
-            for tab in tabs_data:
-                tab_query = """
-                    INSERT INTO session_tabs (session_id, url, title, position, is_active)
-                    VALUES (?, ?, ?, ?, ?)
-                """
-                self.execute_update(tab_query, (
-                    session_id,
-                    tab.get('url', ''),
-                    tab.get('title', 'Nueva pestaña'),
-                    tab.get('position', 0),
-                    1 if tab.get('is_active', False) else 0
-                ))
+            # Borrado del auto-save previo, sesión y pestañas en una sola
+            # transacción: la sesión se guarda completa o no se guarda
+            with self.transaction("browser_sessions", "session_tabs") as conn:
+                # Si es auto-save, eliminar sesiones auto-save anteriores
+                if is_auto_save:
+                    conn.execute("DELETE FROM browser_sessions WHERE is_auto_save = 1")
+
+                # Crear sesión
+                session_id = conn.execute(
+                    "INSERT INTO browser_sessions (name, is_auto_save) VALUES (?, ?)",
+                    (name, 1 if is_auto_save else 0)
+                ).lastrowid
+
+                # Guardar pestañas: una sola sentencia; json_each expande en
+                # SQLite el array [url, title, position, is_active] de cada pestaña
+                tabs_json = _json_dumps([
+                    [
+                        tab.get('url', ''),
+                        tab.get('title', 'Nueva pestaña'),
+                        tab.get('position', 0),
+                        1 if tab.get('is_active', False) else 0
+                    ]
+                    for tab in tabs_data
+                ])
+                conn.execute(INSERT_SESSION_TABS_SQL, (session_id, tabs_json))
 
             logger.info(f"Sesión guardada: {name} (ID: {session_id}) con {len(tabs_data)} pestañas")
             return session_id
@@ -2109,23 +3043,21 @@ class DBManager:
             Lista de diccionarios con información de sesiones
         """
         try:
-            if include_auto_save:
-                query = """
-                    SELECT id, name, is_auto_save, created_at, updated_at,
-                           (SELECT COUNT(*) FROM session_tabs WHERE session_id = browser_sessions.id) as tab_count
-                    FROM browser_sessions
-                    ORDER BY created_at DESC
-                """
-            else:
-                query = """
-                    SELECT id, name, is_auto_save, created_at, updated_at,
-                           (SELECT COUNT(*) FROM session_tabs WHERE session_id = browser_sessions.id) as tab_count
-                    FROM browser_sessions
-                    WHERE is_auto_save = 0
-                    ORDER BY created_at DESC
-                """
+            # Conteo de pestañas con un solo JOIN agrupado (usa
+            # idx_session_tabs_session_position) en lugar de un COUNT por sesión
+            query = """
+                SELECT bs.id, bs.name, bs.is_auto_save, bs.created_at, bs.updated_at,
+                       COUNT(st.id) as tab_count
+                FROM browser_sessions bs
+                LEFT JOIN session_tabs st ON st.session_id = bs.id
+                WHERE bs.is_auto_save = 0 OR ? = 1
+                GROUP BY bs.id
+                ORDER BY bs.created_at DESC
+            """
 
-            result = self.execute_query(query)
+            result = self._cached_query(
+                query, (int(include_auto_save),), ("browser_sessions", "session_tabs")
+            )
             return result if result else []
 
         except Exception as e:
@@ -2149,7 +3081,7 @@ class DBManager:
                 WHERE session_id = ?
                 ORDER BY position ASC
             """
-            result = self.execute_query(query, (session_id,))
+            result = self._cached_query(query, (session_id,), ("session_tabs",))
             return result if result else []
 
         except Exception as e:
@@ -2171,7 +3103,7 @@ class DBManager:
                 ORDER BY created_at DESC
                 LIMIT 1
             """
-            result = self.execute_query(query)
+            result = self._cached_query(query, (), ("browser_sessions",))
             return result[0] if result else None
 
         except Exception as e:
@@ -2190,8 +3122,11 @@ class DBManager:
         """
         try:
             # Las pestañas se eliminan automáticamente por la cláusula ON DELETE CASCADE
-            delete_query = "DELETE FROM browser_sessions WHERE id = ?"
-            self.execute_update(delete_query, (session_id,))
+            with self.transaction("browser_sessions") as conn:
+                deleted = conn.execute("DELETE FROM browser_sessions WHERE id = ?", (session_id,)).rowcount
+            if not deleted:
+                logger.warning(f"Sesión no encontrada: {session_id}")
+                return False
             logger.info(f"Sesión eliminada: {session_id}")
             return True
 
@@ -2264,19 +3199,15 @@ class DBManager:
         Returns:
             int: ID de la pestaña creada
         """
-        if position is None:
-            # Obtener última posición
-            result = self.execute_query(
-                "SELECT MAX(position) as max_pos FROM notebook_tabs"
-            )
-            max_pos = result[0]['max_pos'] if result and result[0]['max_pos'] is not None else -1
-            position = max_pos + 1
-
+        # Posición indicada o la siguiente (calculada en la misma sentencia)
         query = """
             INSERT INTO notebook_tabs (title, position, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
+            VALUES (?, COALESCE(?, (SELECT COALESCE(MAX(position), -1) + 1 FROM notebook_tabs)),
+                    CURRENT_TIMESTAMP)
+            RETURNING id, position
         """
-        tab_id = self.execute_update(query, (title, position))
+        row = self.execute_returning(query, (title, position))[0]
+        tab_id, position = row['id'], row['position']
         logger.info(f"Notebook tab created: '{title}' (ID: {tab_id}, position: {position})")
         return tab_id
 
@@ -2300,19 +3231,19 @@ class DBManager:
         updates = []
         values = []
 
-        for field, value in fields.items():
+        # Orden estable de columnas: misma forma -> mismo SQL (cache de sentencias)
+        for field, value in sorted(fields.items()):
             if field in allowed_fields:
-                updates.append(f"{field} = ?")
+                updates.append(field)
                 values.append(value)
 
         if not updates:
             logger.warning(f"No valid fields to update for notebook tab {tab_id}")
             return False
 
-        updates.append("updated_at = CURRENT_TIMESTAMP")
         values.append(tab_id)
 
-        query = f"UPDATE notebook_tabs SET {', '.join(updates)} WHERE id = ?"
+        query = _build_update_sql("notebook_tabs", tuple(updates))
 
         try:
             self.execute_update(query, tuple(values))
@@ -2352,7 +3283,7 @@ class DBManager:
             bool: True si se reordenó correctamente
         """
         try:
-            with self.transaction() as conn:
+            with self.transaction("notebook_tabs") as conn:
                 cursor = conn.cursor()
                 for position, tab_id in enumerate(tab_ids_in_order):
                     cursor.execute(
@@ -2372,9 +3303,7 @@ class DBManager:
         Returns:
             int: Número de pestañas
         """
-        query = "SELECT COUNT(*) as count FROM notebook_tabs"
-        result = self.execute_query(query)
-        return result[0]['count'] if result else 0
+        return self.execute_scalar("SELECT COUNT(*) FROM notebook_tabs", default=0)
 
     # ==================== Context Manager ====================
 
@@ -84,6 +84,9 @@ def migrate_json_to_sqlite(
 
         print(f"✅ Configuraciones migradas: {stats['settings']} settings")
 
+        # Items from steps 4 and 5, inserted together via bulk_load
+        item_rows = []
+
         # Step 4: Load and migrate default_categories.json
         defaults_path = Path(json_defaults_path)
 
@@ -106,23 +109,18 @@ def migrate_json_to_sqlite(
                 )
                 stats['categories'] += 1
 
-                # Add items for this category
+                # Queue items for this category (inserted in one bulk load)
                 items = cat_data.get('items', [])
-                for item_data in items:
-                    # Determine item type
-                    content = item_data['content']
-                    item_type = _determine_item_type(content)
-
-                    db.add_item(
-                        category_id=cat_id,
-                        label=item_data['label'],
-                        content=content,
-                        item_type=item_type,
-                        icon=item_data.get('icon'),
-                        is_sensitive=item_data.get('is_sensitive', False),
-                        tags=item_data.get('tags', [])
-                    )
-                    stats['items'] += 1
+                item_rows.extend([{
+                    'category_id': cat_id,
+                    'label': item_data['label'],
+                    'content': item_data['content'],
+                    'item_type': _determine_item_type(item_data['content']),
+                    'icon': item_data.get('icon'),
+                    'is_sensitive': item_data.get('is_sensitive', False),
+                    'tags': item_data.get('tags', [])
+                } for item_data in items])
+                stats['items'] += len(items)
 
                 print(f"   ✓ {cat_data['name']}: {len(items)} items")
 
@@ -145,22 +143,18 @@ def migrate_json_to_sqlite(
                 )
                 stats['categories'] += 1
 
-                # Add items
+                # Queue items (inserted in one bulk load)
                 items = cat_data.get('items', [])
-                for item_data in items:
-                    content = item_data['content']
-                    item_type = _determine_item_type(content)
-
-                    db.add_item(
-                        category_id=cat_id,
-                        label=item_data['label'],
-                        content=content,
-                        item_type=item_type,
-                        icon=item_data.get('icon'),
-                        is_sensitive=item_data.get('is_sensitive', False),
-                        tags=item_data.get('tags', [])
-                    )
-                    custom_items_count += 1
+                item_rows.extend([{
+                    'category_id': cat_id,
+                    'label': item_data['label'],
+                    'content': item_data['content'],
+                    'item_type': _determine_item_type(item_data['content']),
+                    'icon': item_data.get('icon'),
+                    'is_sensitive': item_data.get('is_sensitive', False),
+                    'tags': item_data.get('tags', [])
+                } for item_data in items])
+                custom_items_count += len(items)
 
                 print(f"   ✓ {cat_data['name']}: {len(items)} items")
 
@@ -168,6 +162,9 @@ def migrate_json_to_sqlite(
         else:
             print("✅ Sin categorías personalizadas")
 
+        # Insert all queued items with the items indexes rebuilt once
+        db.bulk_load(item_rows)
+
         # Step 6: Migrate clipboard history
         print("\n[6/6] Migrando historial de portapapeles...")
         history = config_data.get('history', [])
@@ -183,6 +180,9 @@ def migrate_json_to_sqlite(
         else:
             print("✅ Sin historial previo")
 
+        # Planner statistics for the freshly seeded tables (one-time cost)
+        db.analyze()
+
         # Close database connection
         db.close()
 
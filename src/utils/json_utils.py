@@ -0,0 +1,30 @@
+"""
+JSON helpers
+Uses orjson when it is installed and falls back to the stdlib json module
+"""
+
+import json
+
+# orjson (optional) parses/serializes several times faster than the stdlib.
+# The fallback emits the same compact, non-ASCII-escaped text, so stored
+# values look the same whichever backend wrote them.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching json.JSONDecodeError.
+try:
+    import orjson
+
+    def loads(raw):
+        """Parse a JSON document (str or bytes)"""
+        return orjson.loads(raw)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string"""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def loads(raw):
+        """Parse a JSON document (str or bytes)"""
+        return json.loads(raw)
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
@@ -323,7 +323,7 @@ class BrowserSettings(QWidget):
                 'width': width,
                 'height': height
             }
-            self.browser_manager.db.save_browser_config(config)
+            self.browser_manager.save_browser_config(config)
 
             # Update browser manager
             self.browser_manager.set_home_url(home_url)
@@ -273,8 +273,8 @@ class CategoryEditor(QWidget):
             for cat in self.categories:
                 logger.debug(f"  - {cat.name}: {len(cat.items)} items")
         else:
-            # Fallback to controller (shouldn't happen)
-            self.categories = self.controller.get_categories()
+            # Fallback to controller (shouldn't happen); copy, the editor mutates its list
+            self.categories = list(self.controller.get_categories())
 
         self.refresh_categories_list()
 
@@ -8,6 +8,7 @@ from PyQt6.QtGui import QFont
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from models.item import Item
@@ -20,27 +21,32 @@ logger = logging.getLogger(__name__)
 class ItemDetailsDialog(QDialog):
     """Diálogo que muestra información detallada de un item"""
 
-    def __init__(self, item: Item, parent=None):
+    def __init__(self, item: Item, parent=None, db: Optional[DBManager] = None):
+        """
+        Args:
+            item: Item a mostrar
+            parent: Widget padre
+            db: DBManager de la aplicación (ConfigManager.db); si no se
+                indica se abre uno temporal solo para leer la categoría
+        """
         super().__init__(parent)
         self.item = item
-        self.db = DBManager()
+        self.db = db
         self.category_name = self.get_category_name()
         self.init_ui()
 
     def get_category_name(self) -> str:
         """Obtener el nombre de la categoría del item"""
+        db = self.db or DBManager()
         try:
-            # Buscar la categoría a la que pertenece este item
-            categories = self.db.get_all_categories()
-            for category in categories:
-                items = self.db.get_items_by_category(category.id)
-                for item in items:
-                    if item.id == self.item.id:
-                        return category.name
-            return "Desconocida"
+            # Una sola lectura por clave primaria (sin descifrar el contenido)
+            return db.get_item_category_name(self.item.id) or "Desconocida"
         except Exception as e:
             logger.error(f"Error getting category name: {e}")
             return "Desconocida"
+        finally:
+            if db is not self.db:
+                db.close()
 
     def init_ui(self):
         """Inicializar UI"""
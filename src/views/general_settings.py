@@ -86,6 +86,12 @@ class GeneralSettings(QWidget):
         self.start_windows_check.setEnabled(False)
         behavior_layout.addWidget(self.start_windows_check)
 
+        # Prewarm browser checkbox
+        self.prewarm_browser_check = QCheckBox("Precargar el navegador al iniciar (abre más rápido)")
+        self.prewarm_browser_check.setChecked(False)
+        self.prewarm_browser_check.stateChanged.connect(self.settings_changed)
+        behavior_layout.addWidget(self.prewarm_browser_check)
+
         behavior_group.setLayout(behavior_layout)
         main_layout.addWidget(behavior_group)
 
@@ -219,6 +225,10 @@ class GeneralSettings(QWidget):
         start_windows = self.config_manager.get_setting("start_with_windows", False)
         self.start_windows_check.setChecked(start_windows)
 
+        # Load prewarm browser (default False: the browser is created on first use)
+        prewarm_browser = self.config_manager.get_setting("prewarm_browser", False)
+        self.prewarm_browser_check.setChecked(prewarm_browser)
+
         # Load max history
         max_history = self.config_manager.get_setting("max_history", 20)
         self.max_history_spin.setValue(max_history)
@@ -334,5 +344,6 @@ class GeneralSettings(QWidget):
             "minimize_to_tray": self.minimize_tray_check.isChecked(),
             "always_on_top": self.always_on_top_check.isChecked(),
             "start_with_windows": self.start_windows_check.isChecked(),
+            "prewarm_browser": self.prewarm_browser_check.isChecked(),
             "max_history": self.max_history_spin.value()
         }
@@ -290,6 +290,7 @@ class SettingsWindow(QDialog):
             self.config_manager.set_setting("minimize_to_tray", general_settings["minimize_to_tray"])
             self.config_manager.set_setting("always_on_top", general_settings["always_on_top"])
             self.config_manager.set_setting("start_with_windows", general_settings["start_with_windows"])
+            self.config_manager.set_setting("prewarm_browser", general_settings["prewarm_browser"])
             self.config_manager.set_setting("max_history", general_settings["max_history"])
             logger.debug("General settings saved")
 
@@ -299,10 +300,6 @@ class SettingsWindow(QDialog):
             logger.info(f"Got {len(categories)} categories from editor")
 
             if self.controller:
-                # Update controller's categories
-                logger.debug("Updating controller categories...")
-                self.controller.categories = categories
-
                 # Get existing categories from database to avoid duplicates
                 existing_categories = self.config_manager.get_categories()
                 existing_ids = {cat.id: cat for cat in existing_categories}
@@ -818,7 +818,10 @@ class ItemButton(QFrame):
     def show_details(self):
         """Mostrar ventana de detalles del item"""
         try:
-            dialog = ItemDetailsDialog(self.item, parent=self.window())
+            # Reutilizar el DBManager de la aplicación si la ventana lo expone
+            config_manager = getattr(self.window(), 'config_manager', None)
+            db = config_manager.db if config_manager else None
+            dialog = ItemDetailsDialog(self.item, parent=self.window(), db=db)
             dialog.exec()
         except Exception as e:
             logger.error(f"Error showing item details: {e}")
@@ -0,0 +1,242 @@
+"""
+Test script for the DBManager data path
+(reader pool, query cache, transactions, lists, reordering, buffered last_used)
+Run this to verify the read/write path is consistent
+
+Usage:
+    python test_db_data_path.py
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import database.db_manager as db_module
+from database.db_manager import DBManager
+import logging
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def create_file_db() -> DBManager:
+    """File-backed database, so reads go through the reader pool"""
+    tmp_dir = tempfile.mkdtemp(prefix="widget_sidebar_test_")
+    return DBManager(str(Path(tmp_dir) / "test.db"))
+
+
+def test_cache_invalidation():
+    """Cached getters must see writes from execute_update, transaction() and triggers"""
+    print("\n[1/6] Testing query cache invalidation...")
+    db = create_file_db()
+    other = DBManager(str(db.db_path))
+
+    # execute_update invalidates the table it writes
+    assert db.get_setting('theme') == 'dark', "Default theme should be dark"
+    db.execute_update("UPDATE settings SET value = ? WHERE key = ?", ('"light"', 'theme'))
+    assert db.get_setting('theme') == 'light', "execute_update should invalidate settings"
+    print("[OK] execute_update invalidates cached reads")
+
+    # transaction(tables) invalidates only when the block commits
+    category_id = db.add_category(name="Cache Test", icon="C")
+    assert db.get_category(category_id)['name'] == "Cache Test"
+    with db.transaction("categories") as conn:
+        conn.execute("UPDATE categories SET name = ? WHERE id = ?", ("Renamed", category_id))
+    assert db.get_category(category_id)['name'] == "Renamed", \
+        "transaction('categories') should invalidate categories"
+    print("[OK] transaction(tables) invalidates cached reads")
+
+    # Triggers: inserting items updates categories.item_count
+    assert db.get_category_counts().get(category_id, 0) == 0
+    db.add_item(category_id, "Item 1", "content 1")
+    db.add_item(category_id, "Item 2", "content 2")
+    assert db.get_category_counts()[category_id] == 2, \
+        "Writes to items should invalidate categories (item_count trigger)"
+    print("[OK] Trigger-written tables are invalidated")
+
+    # A second DBManager on the same file shares the table versions
+    assert other.get_category(category_id)['name'] == "Renamed"
+    db.update_category(category_id, name="Shared")
+    assert other.get_category(category_id)['name'] == "Shared", \
+        "Writes through one instance should invalidate the other's cache"
+    print("[OK] Cache versions are shared between instances")
+
+    other.close()
+    db.close()
+
+
+def test_reads_inside_transaction():
+    """Reads inside transaction() see its own writes; other threads do not"""
+    print("\n[2/6] Testing reads inside transaction()...")
+    db = create_file_db()
+    db.add_bookmark("First", "https://example.com/1")
+
+    with db.transaction("bookmarks") as conn:
+        conn.execute(
+            "INSERT INTO bookmarks (title, url, order_index) VALUES (?, ?, ?)",
+            ("Second", "https://example.com/2", 1)
+        )
+        assert len(db.get_bookmarks()) == 2, "Owning thread should see its uncommitted insert"
+
+        seen = []
+        reader = threading.Thread(target=lambda: seen.append(len(db.get_bookmarks())))
+        reader.start()
+        reader.join()
+        assert seen == [1], "Other threads should only see committed rows"
+
+    assert len(db.get_bookmarks()) == 2, "Committed insert should be visible"
+    print("[OK] Transaction reads are consistent")
+    db.close()
+
+
+def test_update_list():
+    """update_list keeps IDs for common positions and handles grow/shrink"""
+    print("\n[3/6] Testing update_list()...")
+    db = create_file_db()
+    category_id = db.add_category(name="Lists", icon="L")
+    ids = db.create_list(category_id, "Setup", [
+        {'label': 'Step 1', 'content': 'one'},
+        {'label': 'Step 2', 'content': 'two'},
+    ])
+    assert len(ids) == 2
+
+    # Grow: existing steps keep their IDs, the new one is appended
+    assert db.update_list(category_id, "Setup", items_data=[
+        {'label': 'Step 1', 'content': 'one v2'},
+        {'label': 'Step 2', 'content': 'two'},
+        {'label': 'Step 3', 'content': 'three'},
+    ])
+    items = db.get_list_items(category_id, "Setup")
+    assert [i['label'] for i in items] == ['Step 1', 'Step 2', 'Step 3']
+    assert [i['orden_lista'] for i in items] == [1, 2, 3]
+    assert [i['id'] for i in items[:2]] == ids, "Common positions should keep their IDs"
+    assert items[0]['content'] == 'one v2'
+    assert db.get_category_counts()[category_id] == 3
+    print("[OK] List grows")
+
+    # Shrink (and rename): surplus steps are deleted
+    assert db.update_list(category_id, "Setup", new_list_group="Install", items_data=[
+        {'label': 'Only step', 'content': 'only'},
+    ])
+    assert db.get_list_items(category_id, "Setup") == []
+    items = db.get_list_items(category_id, "Install")
+    assert [(i['id'], i['label'], i['orden_lista']) for i in items] == [(ids[0], 'Only step', 1)]
+    assert db.get_category_counts()[category_id] == 1
+    print("[OK] List shrinks and is renamed")
+    db.close()
+
+
+def test_reorder_list_item():
+    """reorder_list_item shifts the items between both positions"""
+    print("\n[4/6] Testing reorder_list_item()...")
+    db = create_file_db()
+    category_id = db.add_category(name="Reorder", icon="R")
+    ids = db.create_list(category_id, "Steps", [
+        {'label': f'Step {n}', 'content': str(n)} for n in range(1, 5)
+    ])
+
+    def order():
+        return [i['id'] for i in db.get_list_items(category_id, "Steps")]
+
+    assert db.reorder_list_item(ids[0], 3)
+    assert order() == [ids[1], ids[2], ids[0], ids[3]], "Moving down should shift the range up"
+    assert db.reorder_list_item(ids[3], 1)
+    assert order() == [ids[3], ids[1], ids[2], ids[0]], "Moving up should shift the range down"
+    orders = [i['orden_lista'] for i in db.get_list_items(category_id, "Steps")]
+    assert orders == [1, 2, 3, 4], "Positions should stay consecutive"
+    print("[OK] List items reordered")
+    db.close()
+
+
+def test_reorder_speed_dial():
+    """reorder_speed_dial moves one tile and keeps positions consecutive"""
+    print("\n[5/6] Testing reorder_speed_dial()...")
+    db = create_file_db()
+    ids = [db.add_speed_dial(f"Site {n}", f"https://site{n}.com") for n in range(4)]
+
+    def order():
+        return [d['id'] for d in db.get_speed_dials()]
+
+    assert order() == ids
+    assert db.reorder_speed_dial(ids[0], 2)
+    assert order() == [ids[1], ids[2], ids[0], ids[3]]
+    assert db.reorder_speed_dial(ids[3], 0)
+    assert order() == [ids[3], ids[1], ids[2], ids[0]]
+    assert db.reorder_speed_dial(ids[1], 99), "Out of range positions are clamped"
+    assert order() == [ids[3], ids[2], ids[0], ids[1]]
+    assert [d['position'] for d in db.get_speed_dials()] == [0, 1, 2, 3]
+    print("[OK] Speed dials reordered")
+    db.close()
+
+
+def test_last_used_flush():
+    """Buffered last_used is written by the timer and by close()"""
+    print("\n[6/6] Testing buffered last_used flush...")
+    original_delay = db_module.LAST_USED_FLUSH_SECONDS
+    db_module.LAST_USED_FLUSH_SECONDS = 0.1
+    try:
+        db = create_file_db()
+        category_id = db.add_category(name="Usage", icon="U")
+        item_id = db.add_item(category_id, "Used", "content")
+
+        # Timer flush
+        db.update_last_used(item_id)
+        assert db.get_item(item_id)['last_used'] is None, "Write should be buffered"
+        time.sleep(0.5)
+        assert db.get_item(item_id)['last_used'] is not None, "Timer should flush last_used"
+        print("[OK] Timer flush")
+
+        # close() flushes whatever is still pending
+        db_module.LAST_USED_FLUSH_SECONDS = 60
+        second_id = db.add_item(category_id, "Used later", "content")
+        db.update_last_used(second_id)
+        db.close()
+        reopened = DBManager(str(db.db_path))
+        assert reopened.get_item(second_id)['last_used'] is not None, "close() should flush last_used"
+        reopened.close()
+        print("[OK] close() flush")
+    finally:
+        db_module.LAST_USED_FLUSH_SECONDS = original_delay
+
+
+def run_all_tests():
+    """Run every data path test"""
+    print("="*60)
+    print("Testing DBManager Data Path")
+    print("="*60)
+
+    test_cache_invalidation()
+    test_reads_inside_transaction()
+    test_update_list()
+    test_reorder_list_item()
+    test_reorder_speed_dial()
+    test_last_used_flush()
+
+    print("\n" + "="*60)
+    print("ALL TESTS PASSED!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    try:
+        run_all_tests()
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n[ERROR] Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -22,6 +22,13 @@ sys.path.insert(0, str(base_dir))
 
 logger = logging.getLogger(__name__)
 
+# Partial index: only the (single) default profile is indexed, so finding it
+# and switching defaults touch one row instead of scanning the table
+DEFAULT_PROFILE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_browser_profiles_default
+    ON browser_profiles(is_default) WHERE is_default = 1
+"""
+
 
 def run_migration():
     """Run the migration to add browser_profiles table."""
@@ -46,6 +53,8 @@ def run_migration():
 
         if cursor.fetchone():
             print("[WARNING] Tabla 'browser_profiles' ya existe")
+            cursor.execute(DEFAULT_PROFILE_INDEX_SQL)
+            conn.commit()
             conn.close()
             return True
 
@@ -62,6 +71,7 @@ def run_migration():
                 last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        cursor.execute(DEFAULT_PROFILE_INDEX_SQL)
 
         # Create default profile
         print("[INFO] Creando perfil por defecto...")